@@ -10,36 +10,78 @@ Failover:
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
-import json
+import math
 import os
+import random
+import re
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Any, Optional
 
 import httpx
+import orjson
 import structlog
 
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    aioredis = None
+    REDIS_AVAILABLE = False
+
 logger = structlog.get_logger()
 
 # ── Endpoints ────────────────────────────────────────────────────────────────
 GEMINI_URL = "https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent"
 OPENAI_URL = "https://api.openai.com/v1/chat/completions"
 
+# ── Shared HTTP clients ───────────────────────────────────────────────────────
+# Built lazily once and reused so Gemini/OpenAI calls ride warm keep-alive
+# connections instead of paying a TCP+TLS handshake per request.
+_HTTP_LIMITS = httpx.Limits(max_connections=1000, max_keepalive_connections=100)
+_gemini_client: httpx.AsyncClient | None = None
+_openai_client: httpx.AsyncClient | None = None
+
 # ── Rate-limit pauses ─────────────────────────────────────────────────────────
-_gemini_paused_until: float = 0.0
-_openai_paused_until: float = 0.0
+# Exponential back-off with jitter per provider; mirrored to Redis (rl:<provider>)
+# so every worker backs off together instead of stampeding the quota on resume.
+RATE_LIMIT_BASE_PAUSE = 60
+RATE_LIMIT_MAX_PAUSE = 900
+RATE_LIMIT_SYNC_INTERVAL = 10
+_paused_until: dict[str, float] = {"gemini": 0.0, "openai": 0.0}
+_rate_limit_strikes: dict[str, int] = {"gemini": 0, "openai": 0}
+_last_pause_sync: float = 0.0
 
 # ── In-memory cache ───────────────────────────────────────────────────────────
 _cache: dict[str, tuple[float, Any]] = {}
 CACHE_TTL = 300  # 5 minutes
+CACHE_SWEEP_INTERVAL = 60
+_cache_stats: dict[str, int] = {"hits": 0, "misses": 0}
+
+# ── Semantic cache bucketing ──────────────────────────────────────────────────
+SEMANTIC_PRICE_BUCKET = 0.02
+_NON_WORD_RE = re.compile(r"[^a-z0-9 ]+")
+
+# ── Redis (optional, shared pool) ─────────────────────────────────────────────
+REDIS_MAX_CONNECTIONS = 50
+_redis_client: Any = None
+
+# ── Analyst concurrency ───────────────────────────────────────────────────────
+ANALYST_MAX_PARALLEL = 3
+
+# ── Analyst prefetch (cache priming from the scanner) ─────────────────────────
+PREFETCH_MAX_IN_FLIGHT = 3
+_prefetch_tasks: dict[str, asyncio.Task] = {}
 
 
 # =============================================================================
 # Dataclasses
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MarketSummary:
     """Lightweight market data for scanner."""
     market_id: str
@@ -50,15 +92,16 @@ class MarketSummary:
     liquidity: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AlphaCandidate:
     """Market flagged by scanner as potential alpha."""
     market: MarketSummary
     scanner_confidence: float
     scanner_reasoning: str
+    scanner_model: str = "gemini-1.5-flash"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CouncilDecision:
     """Final decision from the Analyst."""
     market_id: str
@@ -78,61 +121,200 @@ class CouncilDecision:
 # =============================================================================
 
 def _cache_key(market_id: str, role: str) -> str:
-    return f"be:{role}:{hashlib.md5(market_id.encode()).hexdigest()}"
+    # Market IDs are already short and unique — no need to hash them.
+    return f"be:{role}:{market_id}"
+
+
+def _semantic_key(m: MarketSummary, role: str) -> str:
+    """
+    Key on the market *state* rather than its ID so a near-identical
+    question/price/volume snapshot reuses a previous verdict.
+    """
+    question = " ".join(_NON_WORD_RE.sub(" ", m.question.lower()).split())
+    price_bucket = round(m.yes_price / SEMANTIC_PRICE_BUCKET)
+    volume_bucket = int(math.log10(m.volume24hr)) if m.volume24hr >= 1 else 0
+    digest = hashlib.blake2b(
+        f"{question}|{price_bucket}|{volume_bucket}".encode(), digest_size=16
+    ).hexdigest()
+    return f"be:{role}:sem:{digest}"
 
 
 def _cache_get(key: str) -> Optional[Any]:
     entry = _cache.get(key)
-    if entry and (time.time() - entry[0]) < CACHE_TTL:
+    if entry and (time.monotonic() - entry[0]) < CACHE_TTL:
         return entry[1]
-    _cache.pop(key, None)
     return None
 
 
 def _cache_set(key: str, value: Any) -> None:
-    _cache[key] = (time.time(), value)
+    _cache[key] = (time.monotonic(), value)
+
+
+def _cache_sweep() -> int:
+    """Drop every expired entry in one pass. Returns the number removed."""
+    now = time.monotonic()
+    expired = [k for k, (t, _) in _cache.items() if now - t >= CACHE_TTL]
+    for k in expired:
+        _cache.pop(k, None)
+    return len(expired)
+
+
+async def cache_sweeper_loop(interval: float = CACHE_SWEEP_INTERVAL) -> None:
+    """Background task: periodically evict expired cache entries."""
+    while True:
+        await asyncio.sleep(interval)
+        removed = _cache_sweep()
+        if removed:
+            logger.debug("Council cache swept", removed=removed, size=len(_cache))
+
+
+async def _cache_lookup(key: str) -> Optional[dict]:
+    """In-memory first, then Redis (backfilling memory on a Redis hit)."""
+    cached = _cache_get(key)
+    if cached is None:
+        cached_raw = await _try_redis_get(key)
+        cached = _parse_json_safe(cached_raw) if cached_raw else None
+        if cached is not None:
+            _cache_set(key, cached)
+    return cached
+
+
+def _get_redis() -> Any:
+    """Return a pooled async Redis client, or None when REDIS_URL is unset."""
+    global _redis_client
+    if _redis_client is not None:
+        return _redis_client
+    redis_url = os.environ.get("REDIS_URL", "")
+    if not redis_url or not REDIS_AVAILABLE:
+        return None
+    try:
+        pool = aioredis.ConnectionPool.from_url(
+            redis_url,
+            max_connections=REDIS_MAX_CONNECTIONS,
+            decode_responses=True,
+            socket_timeout=2,
+        )
+        _redis_client = aioredis.Redis(connection_pool=pool)
+    except Exception:
+        return None
+    return _redis_client
 
 
-def _try_redis_get(key: str) -> Optional[str]:
-    redis_url = os.environ.get("REDIS_URL", "")
-    if not redis_url:
+async def _try_redis_get(key: str) -> Optional[str]:
+    r = _get_redis()
+    if r is None:
         return None
     try:
-        import redis as redis_lib
-        r = redis_lib.Redis.from_url(redis_url, decode_responses=True, socket_timeout=2)
-        return r.get(key)
+        return await r.get(key)
     except Exception:
         return None
 
 
-def _try_redis_set(key: str, value: str) -> None:
-    redis_url = os.environ.get("REDIS_URL", "")
-    if not redis_url:
+async def _try_redis_set(key: str, value: bytes) -> None:
+    r = _get_redis()
+    if r is None:
         return
     try:
-        import redis as redis_lib
-        r = redis_lib.Redis.from_url(redis_url, decode_responses=True, socket_timeout=2)
-        r.setex(key, CACHE_TTL, value)
+        await r.setex(key, CACHE_TTL, value)
     except Exception:
         pass
 
 
+# =============================================================================
+# HTTP clients
+# =============================================================================
+
+def _get_gemini_client() -> httpx.AsyncClient:
+    global _gemini_client
+    if _gemini_client is None or _gemini_client.is_closed:
+        _gemini_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(25.0, connect=5.0),
+            limits=_HTTP_LIMITS,
+        )
+    return _gemini_client
+
+
+def _get_openai_client() -> httpx.AsyncClient:
+    global _openai_client
+    if _openai_client is None or _openai_client.is_closed:
+        _openai_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=_HTTP_LIMITS,
+        )
+    return _openai_client
+
+
+async def close_clients() -> None:
+    """Close the shared LLM HTTP clients and Redis pool (called on shutdown)."""
+    global _gemini_client, _openai_client, _redis_client
+    for client in (_gemini_client, _openai_client):
+        if client is not None and not client.is_closed:
+            await client.aclose()
+    _gemini_client = None
+    _openai_client = None
+    if _redis_client is not None:
+        try:
+            await _redis_client.aclose()
+        except Exception:
+            pass
+        _redis_client = None
+
+
 # =============================================================================
 # Gemini helpers
 # =============================================================================
 
 def _gemini_available() -> bool:
-    return bool(os.environ.get("GEMINI_API_KEY", "").strip()) and time.time() >= _gemini_paused_until
+    return bool(os.environ.get("GEMINI_API_KEY", "").strip()) and time.time() >= _paused_until["gemini"]
 
 
 def _openai_available() -> bool:
-    return bool(os.environ.get("OPENAI_API_KEY", "").strip()) and time.time() >= _openai_paused_until
+    return bool(os.environ.get("OPENAI_API_KEY", "").strip()) and time.time() >= _paused_until["openai"]
+
+
+async def _pause(provider: str) -> float:
+    """Back off a rate-limited provider: 60s doubling per strike, capped, jittered."""
+    _rate_limit_strikes[provider] += 1
+    strikes = _rate_limit_strikes[provider]
+    pause = min(RATE_LIMIT_BASE_PAUSE * 2 ** (strikes - 1), RATE_LIMIT_MAX_PAUSE)
+    pause *= random.uniform(0.8, 1.5)
+    _paused_until[provider] = max(_paused_until[provider], time.time() + pause)
+
+    r = _get_redis()
+    if r is not None:
+        try:
+            await r.set(f"rl:{provider}", "1", ex=max(1, int(pause)), nx=True)
+        except Exception:
+            pass
+    return pause
+
+
+def _reset_strikes(provider: str) -> None:
+    _rate_limit_strikes[provider] = 0
+
+
+async def _sync_pauses() -> None:
+    """Pull pauses set by other workers from Redis, at most every RATE_LIMIT_SYNC_INTERVAL."""
+    global _last_pause_sync
+    now = time.time()
+    if now - _last_pause_sync < RATE_LIMIT_SYNC_INTERVAL:
+        return
+    _last_pause_sync = now
+
+    r = _get_redis()
+    if r is None:
+        return
+    for provider in _paused_until:
+        try:
+            ttl = await r.ttl(f"rl:{provider}")
+        except Exception:
+            return
+        if ttl and ttl > 0:
+            _paused_until[provider] = max(_paused_until[provider], now + ttl)
 
 
 async def _call_gemini(model: str, prompt: str, max_tokens: int = 512) -> Optional[str]:
     """Low-level Gemini call. Returns raw text or None on failure."""
-    global _gemini_paused_until
-
     api_key = os.environ.get("GEMINI_API_KEY", "").strip()
     if not api_key:
         return None
@@ -144,15 +326,19 @@ async def _call_gemini(model: str, prompt: str, max_tokens: int = 512) -> Option
     }
 
     try:
-        async with httpx.AsyncClient(timeout=25.0) as client:
-            resp = await client.post(f"{url}?key={api_key}", json=payload)
-            if resp.status_code == 429:
-                _gemini_paused_until = time.time() + 60
-                logger.warning("Gemini rate limited — pausing 60s")
-                return None
-            resp.raise_for_status()
-            data = resp.json()
-            return data["candidates"][0]["content"]["parts"][0]["text"].strip()
+        resp = await _get_gemini_client().post(
+            f"{url}?key={api_key}",
+            content=orjson.dumps(payload),
+            headers={"Content-Type": "application/json"},
+        )
+        if resp.status_code == 429:
+            pause = await _pause("gemini")
+            logger.warning("Gemini rate limited — pausing", seconds=round(pause))
+            return None
+        resp.raise_for_status()
+        _reset_strikes("gemini")
+        data = orjson.loads(resp.content)
+        return data["candidates"][0]["content"]["parts"][0]["text"].strip()
     except Exception as e:
         logger.warning("Gemini call failed", model=model, error=str(e)[:80])
         return None
@@ -160,47 +346,55 @@ async def _call_gemini(model: str, prompt: str, max_tokens: int = 512) -> Option
 
 async def _call_openai(model: str, system: str, user: str, max_tokens: int = 400) -> Optional[str]:
     """Low-level OpenAI call. Returns raw text or None on failure."""
-    global _openai_paused_until
-
     api_key = os.environ.get("OPENAI_API_KEY", "").strip()
     if not api_key:
         return None
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            resp = await client.post(
-                OPENAI_URL,
-                headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
-                json={
-                    "model": model,
-                    "messages": [
-                        {"role": "system", "content": system},
-                        {"role": "user", "content": user},
-                    ],
-                    "temperature": 0.1,
-                    "max_tokens": max_tokens,
-                    "response_format": {"type": "json_object"},
-                },
-            )
-            if resp.status_code == 429:
-                _openai_paused_until = time.time() + 60
-                logger.warning("OpenAI rate limited — pausing 60s")
-                return None
-            resp.raise_for_status()
-            return resp.json()["choices"][0]["message"]["content"].strip()
+        resp = await _get_openai_client().post(
+            OPENAI_URL,
+            headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
+            content=orjson.dumps({
+                "model": model,
+                "messages": [
+                    {"role": "system", "content": system},
+                    {"role": "user", "content": user},
+                ],
+                "temperature": 0.1,
+                "max_tokens": max_tokens,
+                "response_format": {"type": "json_object"},
+                "stream": False,
+            }),
+        )
+        if resp.status_code == 429:
+            pause = await _pause("openai")
+            logger.warning("OpenAI rate limited — pausing", seconds=round(pause))
+            return None
+        resp.raise_for_status()
+        _reset_strikes("openai")
+        data = orjson.loads(resp.content)
+        return data["choices"][0]["message"]["content"].strip()
     except Exception as e:
         logger.warning("OpenAI call failed", model=model, error=str(e)[:80])
         return None
 
 
-def _parse_json_safe(text: str) -> Optional[dict]:
+def _parse_json_safe(text: str | bytes) -> Optional[dict]:
     """Parse JSON, stripping markdown fences if present."""
     if not text:
         return None
-    if text.startswith("```"):
+    if isinstance(text, str) and text.startswith("```"):
         text = text.split("\n", 1)[-1].rsplit("```", 1)[0].strip()
     try:
-        return json.loads(text)
+        return orjson.loads(text)
+    except Exception:
+        return None
+
+
+def _parse_openai_json(text: str) -> Optional[dict]:
+    """Parse OpenAI json_object output — guaranteed fence-free, so no stripping."""
+    try:
+        return orjson.loads(text)
     except Exception:
         return None
 
@@ -216,6 +410,50 @@ Respond ONLY with valid JSON:
 
 Include at most 3 candidates. confidence > 0.6 means strong alpha potential."""
 
+_SCANNER_PROMPT_HEADER = "Analyze these prediction markets for mispricing alpha:\n"
+_SCANNER_GEMINI_PREFIX = _SCANNER_SYSTEM + "\n\n"
+
+# Last built scanner prompt, keyed on the (id, question, price, volume) snapshot
+_scanner_prompt_memo: tuple[tuple, str] = ((), "")
+
+# Recent scan results keyed on prompt hash — identical snapshots skip the LLM
+SCAN_CACHE_MAXSIZE = 32
+SCAN_CACHE_TTL = 60
+_scan_cache: OrderedDict[int, tuple[float, list[AlphaCandidate]]] = OrderedDict()
+_scan_cache_stats: dict[str, int] = {"hits": 0, "misses": 0}
+
+
+def _scan_cache_get(key: int) -> Optional[list[AlphaCandidate]]:
+    entry = _scan_cache.get(key)
+    if entry is None:
+        return None
+    if time.monotonic() - entry[0] >= SCAN_CACHE_TTL:
+        _scan_cache.pop(key, None)
+        return None
+    _scan_cache.move_to_end(key)
+    return entry[1]
+
+
+def _scan_cache_set(key: int, candidates: list[AlphaCandidate]) -> None:
+    _scan_cache[key] = (time.monotonic(), candidates)
+    _scan_cache.move_to_end(key)
+    while len(_scan_cache) > SCAN_CACHE_MAXSIZE:
+        _scan_cache.popitem(last=False)
+
+
+def _build_scanner_prompt(markets: list[MarketSummary]) -> str:
+    """Format the scanner prompt, reusing the previous one if the snapshot is unchanged."""
+    global _scanner_prompt_memo
+    fingerprint = tuple((m.market_id, m.question, m.yes_price, m.volume24hr) for m in markets)
+    if fingerprint == _scanner_prompt_memo[0]:
+        return _scanner_prompt_memo[1]
+    prompt = _SCANNER_PROMPT_HEADER + "\n".join([
+        f"- ID: {m.market_id[:16]} | Q: {m.question[:80]} | YES: {m.yes_price:.3f} | VOL: ${m.volume24hr:,.0f}"
+        for m in markets
+    ])
+    _scanner_prompt_memo = (fingerprint, prompt)
+    return prompt
+
 
 async def scan_for_alpha(markets: list[MarketSummary]) -> list[AlphaCandidate]:
     """
@@ -225,17 +463,28 @@ async def scan_for_alpha(markets: list[MarketSummary]) -> list[AlphaCandidate]:
     if not markets:
         return []
 
-    markets_text = "\n".join(
-        f"- ID: {m.market_id[:16]} | Q: {m.question[:80]} | YES: {m.yes_price:.3f} | VOL: ${m.volume24hr:,.0f}"
-        for m in markets[:50]
-    )
-    prompt = f"Analyze these prediction markets for mispricing alpha:\n{markets_text}"
+    prompt = _build_scanner_prompt(markets[:50])
+    prompt_hash = hash(prompt)
+    cached = _scan_cache_get(prompt_hash)
+    if cached is not None:
+        _scan_cache_stats["hits"] += 1
+        logger.info(
+            "Scanner cache hit",
+            candidates=len(cached),
+            hits=_scan_cache_stats["hits"],
+            misses=_scan_cache_stats["misses"],
+        )
+        _prefetch_analysis(cached)
+        return list(cached)
+    _scan_cache_stats["misses"] += 1
+
+    await _sync_pauses()
 
     raw: Optional[str] = None
     scanner_model = "gemini-1.5-flash"
 
     if _gemini_available():
-        raw = await _call_gemini("gemini-1.5-flash", _SCANNER_SYSTEM + "\n\n" + prompt, max_tokens=600)
+        raw = await _call_gemini("gemini-1.5-flash", _SCANNER_GEMINI_PREFIX + prompt, max_tokens=600)
 
     if raw is None and _openai_available():
         logger.info("Scanner: Gemini unavailable — using OpenAI fallback")
@@ -246,24 +495,28 @@ async def scan_for_alpha(markets: list[MarketSummary]) -> list[AlphaCandidate]:
         logger.warning("Scanner: all LLMs unavailable")
         return []
 
-    parsed = _parse_json_safe(raw)
+    parsed = _parse_openai_json(raw) if scanner_model.startswith("gpt") else _parse_json_safe(raw)
     if not parsed or "candidates" not in parsed:
         return []
 
     candidates: list[AlphaCandidate] = []
-    market_map = {m.market_id: m for m in markets}
+    # Full-ID and 16-char prefix index (the prompt only shows ID[:16]), built in one pass
+    market_map: dict[str, MarketSummary] = {}
+    prefix_map: dict[str, MarketSummary] = {}
+    for m in markets:
+        market_map[m.market_id] = m
+        prefix_map.setdefault(m.market_id[:16], m)
 
     for c in parsed["candidates"][:3]:
-        mid = c.get("market_id", "")
-        market = market_map.get(mid) or next(
-            (m for m in markets if mid in m.market_id), None
-        )
+        mid = str(c.get("market_id", ""))
+        market = market_map.get(mid) or prefix_map.get(mid[:16])
         if not market:
             continue
         candidates.append(AlphaCandidate(
             market=market,
             scanner_confidence=float(c.get("confidence", 0.5)),
             scanner_reasoning=str(c.get("reasoning", ""))[:200],
+            scanner_model=scanner_model,
         ))
         logger.info(
             "[ALPHA] Candidate detected",
@@ -272,6 +525,8 @@ async def scan_for_alpha(markets: list[MarketSummary]) -> list[AlphaCandidate]:
             model=scanner_model,
         )
 
+    _scan_cache_set(prompt_hash, candidates)
+    _prefetch_analysis(candidates)
     return candidates
 
 
@@ -289,22 +544,57 @@ Respond ONLY with valid JSON (no markdown):
 Only output JSON, nothing else."""
 
 
+def _prefetch_analysis(candidates: list[AlphaCandidate]) -> None:
+    """
+    Kick off Analyst calls for fresh scanner candidates without awaiting them,
+    so the verdict is (or is about to be) cached when the caller asks for it.
+    Skipped while OpenAI is paused; capped at PREFETCH_MAX_IN_FLIGHT.
+    """
+    if not _openai_available():
+        return
+    for candidate in candidates:
+        mid = candidate.market.market_id
+        if mid in _prefetch_tasks or len(_prefetch_tasks) >= PREFETCH_MAX_IN_FLIGHT:
+            continue
+        task = asyncio.create_task(_analyze(candidate))
+        _prefetch_tasks[mid] = task
+        task.add_done_callback(lambda _t, mid=mid: _prefetch_tasks.pop(mid, None))
+
+
 async def analyze_candidate(candidate: AlphaCandidate) -> Optional[CouncilDecision]:
     """
     Phase 2: Deep analysis of a single candidate.
     GPT-4o first, Gemini Pro fallback.
+    Joins an in-flight prefetch for the same market instead of re-calling the LLM.
     """
-    m = candidate.market
-
-    # Check cache
-    ck = _cache_key(m.market_id, "analyst")
-    cached_str = _try_redis_get(ck) or (str(_cache_get(ck)) if _cache_get(ck) else None)
-    if cached_str and cached_str != "None":
+    pending = _prefetch_tasks.get(candidate.market.market_id)
+    if pending is not None:
         try:
-            result = json.loads(cached_str) if isinstance(cached_str, str) else cached_str
-            return _build_decision(m, result, "gpt-4o (cached)", "gpt-4o (cached)")
+            return await asyncio.shield(pending)
         except Exception:
             pass
+    return await _analyze(candidate)
+
+
+async def _analyze(candidate: AlphaCandidate) -> Optional[CouncilDecision]:
+    m = candidate.market
+
+    # Check cache — exact market first, then semantic (same question/price/volume bucket)
+    ck = _cache_key(m.market_id, "analyst")
+    sk = _semantic_key(m, "analyst")
+    for key in (ck, sk):
+        cached = await _cache_lookup(key)
+        if cached:
+            _cache_stats["hits"] += 1
+            logger.info(
+                "Analyst cache hit",
+                market_id=m.market_id[:16],
+                semantic=key is sk,
+                hits=_cache_stats["hits"],
+                misses=_cache_stats["misses"],
+            )
+            return _build_decision(m, cached, candidate.scanner_model, "gpt-4o (cached)")
+    _cache_stats["misses"] += 1
 
     user_prompt = (
         f"Market: {m.question}\n"
@@ -314,6 +604,7 @@ async def analyze_candidate(candidate: AlphaCandidate) -> Optional[CouncilDecisi
         f"Scanner note: {candidate.scanner_reasoning}"
     )
 
+    await _sync_pauses()
     raw: Optional[str] = None
     analyst_model = "gpt-4o"
 
@@ -333,16 +624,17 @@ async def analyze_candidate(candidate: AlphaCandidate) -> Optional[CouncilDecisi
         logger.warning("Analyst: all LLMs unavailable")
         return None
 
-    parsed = _parse_json_safe(raw)
+    parsed = _parse_openai_json(raw) if analyst_model.startswith("gpt") else _parse_json_safe(raw)
     if not parsed:
         logger.warning("Analyst: invalid JSON response", model=analyst_model)
         return None
 
     # Cache result
     try:
-        encoded = json.dumps(parsed)
-        _cache_set(ck, parsed)
-        _try_redis_set(ck, encoded)
+        encoded = orjson.dumps(parsed)
+        for key in (ck, sk):
+            _cache_set(key, parsed)
+            await _try_redis_set(key, encoded)
     except Exception:
         pass
 
@@ -358,6 +650,49 @@ async def analyze_candidate(candidate: AlphaCandidate) -> Optional[CouncilDecisi
     return decision
 
 
+async def analyze_first_valid(
+    candidates: list[AlphaCandidate],
+    max_parallel: int = ANALYST_MAX_PARALLEL,
+) -> Optional[CouncilDecision]:
+    """
+    Run the Analyst over candidates concurrently, return the first valid
+    decision in candidate (scanner rank) order.
+
+    Results are awaited in rank order; once one is valid, the lower-ranked
+    tasks are cancelled so their Analyst calls stop (or never start).
+    """
+    if not candidates:
+        return None
+
+    sem = asyncio.Semaphore(max_parallel)
+
+    async def _guarded(candidate: AlphaCandidate) -> Optional[CouncilDecision]:
+        async with sem:
+            return await analyze_candidate(candidate)
+
+    tasks = [asyncio.create_task(_guarded(c)) for c in candidates]
+    try:
+        for candidate, task in zip(candidates, tasks):
+            try:
+                decision = await task
+            except Exception as e:
+                logger.warning(
+                    "Analyst: candidate failed",
+                    market_id=candidate.market.market_id[:16],
+                    error=str(e)[:80],
+                )
+                continue
+            if decision:
+                return decision
+        return None
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled():
+                task.exception()  # mark retrieved; lower-ranked failures are moot
+
+
 def _build_decision(
     m: MarketSummary,
     result: dict,
@@ -9,22 +9,28 @@ WS   /logs/{user_id}
 from __future__ import annotations
 
 import os
+import time
 from datetime import datetime, timezone
 
 import httpx
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel, Field
+from sqlalchemy import exists, select
 
 from api.websocket_manager import engine_logs_manager
 from db.credentials import get_polymarket_credentials_decrypted, save_polymarket_credentials
-from db.models import BotInstance, BotStatus, TradeLog, User, UserCredentials, UserTier, init_db
-from db.session import get_session
+from db.models import BotInstance, BotStatus, TradeLog, User, UserCredentials, UserTier
+from db.session import get_async_session
 
 logger = structlog.get_logger()
 
 router = APIRouter(prefix="/api/engine", tags=["engine"])
 
+# Pre-built application-level pong frame for WS /logs
+_PONG_FRAME = '{"type": "pong"}'
+
 
 # -----------------------------------------------------------------------------
 # Mock Auth (user_id=1 until Stripe auth)
@@ -36,20 +42,54 @@ def get_current_user_id() -> int:
     return 1
 
 
-def ensure_user_and_bot(user_id: int) -> None:
-    """Create User and BotInstance if they don't exist."""
-    init_db()
-    with get_session() as session:
-        user = session.query(User).filter(User.id == user_id).first()
-        if not user:
-            user = User(email=f"user{user_id}@blackedge.io", tier=UserTier.PRO, is_active=True)
-            session.add(user)
-            session.flush()
-
-        bot = session.query(BotInstance).filter(BotInstance.user_id == user_id).first()
-        if not bot:
-            bot = BotInstance(user_id=user_id, status=BotStatus.IDLE)
-            session.add(bot)
+# Users whose User + BotInstance rows are known to exist (checked once per process)
+_ensured_users: set[int] = set()
+
+# Short-lived /status cache so rapid dashboard polls don't hit the DB
+STATUS_CACHE_TTL = 1.0
+STATUS_CACHE_MAX_ENTRIES = 10_000
+_status_cache: dict[int, tuple[float, "StatusResponse"]] = {}
+# Bumped on every invalidation; a build that saw it change must not store its
+# (possibly pre-toggle) result
+_status_generation = 0
+
+
+def _invalidate_status(user_id: int) -> None:
+    global _status_generation
+    _status_generation += 1
+    _status_cache.pop(user_id, None)
+
+
+def _store_status(user_id: int, response: "StatusResponse") -> None:
+    now = time.monotonic()
+    if len(_status_cache) >= STATUS_CACHE_MAX_ENTRIES:
+        for uid in [uid for uid, (at, _) in _status_cache.items() if now - at >= STATUS_CACHE_TTL]:
+            del _status_cache[uid]
+        if len(_status_cache) >= STATUS_CACHE_MAX_ENTRIES:
+            _status_cache.clear()
+    _status_cache[user_id] = (now, response)
+
+
+async def ensure_user_and_bot(user_id: int) -> None:
+    """Create User and BotInstance if they don't exist. Tables are created at startup."""
+    if user_id in _ensured_users:
+        return
+    async with get_async_session() as session:
+        # One round-trip probes both rows; inserts only happen on the cold path
+        user_exists, bot_exists = (
+            await session.execute(
+                select(
+                    exists().where(User.id == user_id),
+                    exists().where(BotInstance.user_id == user_id),
+                )
+            )
+        ).one()
+        if not user_exists:
+            session.add(User(email=f"user{user_id}@blackedge.io", tier=UserTier.PRO, is_active=True))
+            await session.flush()
+        if not bot_exists:
+            session.add(BotInstance(user_id=user_id, status=BotStatus.IDLE))
+    _ensured_users.add(user_id)
 
 
 # -----------------------------------------------------------------------------
@@ -98,24 +138,50 @@ class StatusResponse(BaseModel):
     last_log: str = Field("")
 
 
+def _json_response(model: BaseModel) -> Response:
+    """Serialize via pydantic-core's model_dump_json, bypassing jsonable_encoder."""
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
 # -----------------------------------------------------------------------------
 # POST /setup — Onboarding: validate + encrypt Polymarket keys
 # -----------------------------------------------------------------------------
 
 
+_clob_client: httpx.AsyncClient | None = None
+
+
+def _get_clob_client() -> httpx.AsyncClient:
+    """Shared keep-alive client for CLOB credential pings."""
+    global _clob_client
+    if _clob_client is None or _clob_client.is_closed:
+        _clob_client = httpx.AsyncClient(
+            timeout=8.0,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        )
+    return _clob_client
+
+
+async def close_http_client() -> None:
+    """Close the shared CLOB client (called on app shutdown)."""
+    global _clob_client
+    if _clob_client is not None and not _clob_client.is_closed:
+        await _clob_client.aclose()
+    _clob_client = None
+
+
 async def _ping_polymarket_keys(api_key: str, secret: str) -> bool:
     """Validate Polymarket credentials by calling a lightweight CLOB endpoint."""
     clob_url = os.environ.get("POLYMARKET_CLOB_URL", "https://clob.polymarket.com")
     try:
-        async with httpx.AsyncClient(timeout=8.0) as client:
-            resp = await client.get(
-                f"{clob_url}/time",
-                headers={
-                    "POLY_API_KEY": api_key,
-                    "POLY_SECRET": secret,
-                },
-            )
-            return resp.status_code == 200
+        resp = await _get_clob_client().get(
+            f"{clob_url}/time",
+            headers={
+                "POLY_API_KEY": api_key,
+                "POLY_SECRET": secret,
+            },
+        )
+        return resp.status_code == 200
     except Exception as e:
         logger.warning("Polymarket ping failed", error=str(e))
         return False
@@ -131,18 +197,19 @@ async def setup_polymarket_keys(
     1. Ping Polymarket CLOB to validate keys.
     2. Encrypt with Fernet and store in UserCredentials.
     """
-    ensure_user_and_bot(user_id)
-    init_db()
+    await ensure_user_and_bot(user_id)
 
     keys_valid = await _ping_polymarket_keys(request.polymarket_api_key, request.polymarket_proxy_secret)
 
-    with get_session() as session:
-        save_polymarket_credentials(
-            session=session,
-            user_id=user_id,
-            polymarket_proxy_key=request.polymarket_api_key,
-            polymarket_secret=request.polymarket_proxy_secret,
-            polymarket_passphrase=request.polymarket_passphrase,
+    async with get_async_session() as session:
+        await session.run_sync(
+            lambda sync_session: save_polymarket_credentials(
+                session=sync_session,
+                user_id=user_id,
+                polymarket_proxy_key=request.polymarket_api_key,
+                polymarket_secret=request.polymarket_proxy_secret,
+                polymarket_passphrase=request.polymarket_passphrase,
+            )
         )
 
     if keys_valid:
@@ -163,22 +230,21 @@ async def setup_polymarket_keys(
 
 
 @router.post("/activate", response_model=ActivateResponse)
-def activate_bot(
+async def activate_bot(
     user_id: int = Depends(get_current_user_id),
-) -> ActivateResponse:
+) -> Response:
     """
     Activate the bot: set status to RUNNING.
     Requires credentials to be set first (/setup).
     """
-    ensure_user_and_bot(user_id)
-    init_db()
+    await ensure_user_and_bot(user_id)
 
-    with get_session() as session:
-        creds = session.query(UserCredentials).filter(UserCredentials.user_id == user_id).first()
+    async with get_async_session() as session:
+        creds = await session.scalar(select(UserCredentials.id).where(UserCredentials.user_id == user_id))
         if not creds:
             raise HTTPException(status_code=400, detail="No Polymarket credentials. Call /setup first.")
 
-        bot = session.query(BotInstance).filter(BotInstance.user_id == user_id).first()
+        bot = await session.scalar(select(BotInstance).where(BotInstance.user_id == user_id))
         if not bot:
             raise HTTPException(status_code=404, detail="BotInstance not found")
 
@@ -186,8 +252,13 @@ def activate_bot(
         bot.last_heartbeat = datetime.now(timezone.utc)
         bot.last_log = "Bot activated — entering scanner queue..."
 
+    _invalidate_status(user_id)
+    await engine_logs_manager.send_event(
+        user_id,
+        {"type": "status_delta", "status": "RUNNING", "last_log": "Bot activated — entering scanner queue..."},
+    )
     logger.info("Bot activated", user_id=user_id)
-    return ActivateResponse(status="RUNNING", message="Bot activated successfully")
+    return _json_response(ActivateResponse(status="RUNNING", message="Bot activated successfully"))
 
 
 # -----------------------------------------------------------------------------
@@ -196,20 +267,21 @@ def activate_bot(
 
 
 @router.post("/keys", response_model=KeysResponse)
-def store_polymarket_keys(
+async def store_polymarket_keys(
     request: KeysRequest,
     user_id: int = Depends(get_current_user_id),
 ) -> KeysResponse:
     """Store Polymarket API keys (encrypted via Fernet)."""
-    ensure_user_and_bot(user_id)
-    init_db()
-
-    with get_session() as session:
-        save_polymarket_credentials(
-            session=session,
-            user_id=user_id,
-            polymarket_proxy_key=request.proxy_key,
-            polymarket_secret=request.secret,
+    await ensure_user_and_bot(user_id)
+
+    async with get_async_session() as session:
+        await session.run_sync(
+            lambda sync_session: save_polymarket_credentials(
+                session=sync_session,
+                user_id=user_id,
+                polymarket_proxy_key=request.proxy_key,
+                polymarket_secret=request.secret,
+            )
         )
 
     logger.info("Polymarket keys stored", user_id=user_id)
@@ -222,15 +294,14 @@ def store_polymarket_keys(
 
 
 @router.post("/toggle", response_model=ToggleResponse)
-def toggle_bot(
+async def toggle_bot(
     user_id: int = Depends(get_current_user_id),
-) -> ToggleResponse:
+) -> Response:
     """Toggle bot status: IDLE <-> RUNNING."""
-    ensure_user_and_bot(user_id)
-    init_db()
+    await ensure_user_and_bot(user_id)
 
-    with get_session() as session:
-        bot = session.query(BotInstance).filter(BotInstance.user_id == user_id).first()
+    async with get_async_session() as session:
+        bot = await session.scalar(select(BotInstance).where(BotInstance.user_id == user_id))
         if not bot:
             raise HTTPException(status_code=404, detail="BotInstance not found")
 
@@ -245,9 +316,14 @@ def toggle_bot(
             bot.last_log = "Bot started — scanning Polymarket..."
             status_str = "RUNNING"
             message = "Bot started"
+        last_log = bot.last_log
 
+    _invalidate_status(user_id)
+    await engine_logs_manager.send_event(
+        user_id, {"type": "status_delta", "status": status_str, "last_log": last_log}
+    )
     logger.info("Bot toggled", user_id=user_id, new_status=status_str)
-    return ToggleResponse(status=status_str, message=message)
+    return _json_response(ToggleResponse(status=status_str, message=message))
 
 
 # -----------------------------------------------------------------------------
@@ -256,71 +332,86 @@ def toggle_bot(
 
 
 @router.get("/status", response_model=StatusResponse)
-def get_engine_status(
+async def get_engine_status(
     user_id: int = Depends(get_current_user_id),
-) -> StatusResponse:
-    """Dashboard status: status, current_pnl, total_trades_count, last_log."""
-    ensure_user_and_bot(user_id)
-    init_db()
+) -> Response:
+    """
+    Dashboard status: status, current_pnl, total_trades_count, last_log.
+    Cold-start fallback — live updates are pushed over WS /logs/{user_id}.
+    """
+    return _json_response(await _load_status(user_id))
 
-    with get_session() as session:
-        bot = session.query(BotInstance).filter(BotInstance.user_id == user_id).first()
+
+async def _load_status(user_id: int) -> StatusResponse:
+    """Build the StatusResponse for a user (cached for STATUS_CACHE_TTL)."""
+    cached = _status_cache.get(user_id)
+    if cached and time.monotonic() - cached[0] < STATUS_CACHE_TTL:
+        return cached[1]
+
+    generation = _status_generation
+    await ensure_user_and_bot(user_id)
+
+    async with get_async_session() as session:
+        # total_trades_count is maintained on the bot row — no COUNT(*) over trade_logs
+        bot = await session.scalar(select(BotInstance).where(BotInstance.user_id == user_id))
         if not bot:
             return StatusResponse(status="STOPPED", current_pnl=0.0, total_trades_count=0, last_log="")
 
-        total_trades = session.query(TradeLog).filter(TradeLog.user_id == user_id).count()
         status_str = "RUNNING" if bot.status == BotStatus.RUNNING else "STOPPED"
 
-        return StatusResponse(
+        response = StatusResponse(
             status=status_str,
             current_pnl=bot.current_pnl,
-            total_trades_count=total_trades,
+            total_trades_count=bot.total_trades_count,
             last_log=bot.last_log or "",
         )
 
+    if generation == _status_generation:
+        _store_status(user_id, response)
+    return response
+
 
 # -----------------------------------------------------------------------------
 # GET /trades
 # -----------------------------------------------------------------------------
 
 
-@router.get("/trades")
-def get_engine_trades(
+# Columns projected for /trades — Core tuples, no ORM instance hydration
+_TRADE_COLUMNS = (
+    TradeLog.id,
+    TradeLog.market_id,
+    TradeLog.market_question,
+    TradeLog.side,
+    TradeLog.size_usd,
+    TradeLog.price,
+    TradeLog.ia_probability,
+    TradeLog.confidence,
+    TradeLog.status,
+    TradeLog.pnl,
+    TradeLog.executed_at,
+)
+
+
+@router.get("/trades", response_class=ORJSONResponse)
+async def get_engine_trades(
     user_id: int = Depends(get_current_user_id),
     limit: int = Query(50, ge=1, le=200),
-) -> dict:
+) -> ORJSONResponse:
     """List trades executed by the bot for the dashboard."""
-    ensure_user_and_bot(user_id)
-    init_db()
-
-    with get_session() as session:
-        trades = (
-            session.query(TradeLog)
-            .filter(TradeLog.user_id == user_id)
-            .order_by(TradeLog.executed_at.desc())
-            .limit(limit)
-            .all()
-        )
+    await ensure_user_and_bot(user_id)
+
+    async with get_async_session() as session:
+        rows = (
+            await session.execute(
+                select(*_TRADE_COLUMNS)
+                .where(TradeLog.user_id == user_id)
+                .order_by(TradeLog.executed_at.desc())
+                .limit(limit)
+            )
+        ).all()
 
-        return {
-            "trades": [
-                {
-                    "id": t.id,
-                    "market_id": t.market_id,
-                    "market_question": t.market_question,
-                    "side": t.side,
-                    "size_usd": t.size_usd,
-                    "price": t.price,
-                    "ia_probability": t.ia_probability,
-                    "confidence": t.confidence,
-                    "status": t.status,
-                    "pnl": t.pnl,
-                    "executed_at": t.executed_at.isoformat() if t.executed_at else None,
-                }
-                for t in trades
-            ],
-            "count": len(trades),
-        }
+    trades = [dict(row._mapping) for row in rows]  # orjson encodes executed_at as ISO-8601
+    return ORJSONResponse({"trades": trades, "count": len(trades)})
 
 
 # -----------------------------------------------------------------------------
@@ -334,14 +425,23 @@ async def engine_logs_websocket(websocket: WebSocket, user_id: int) -> None:
     WebSocket for real-time Engine logs.
     Connect: ws://host/api/engine/logs/1
     Receives: {"type": "log", "message": "...", "timestamp": "..."}
+              {"type": "status", ...StatusResponse} once on connect
+              {"type": "status_delta", "status": "...", ...} on changes
     """
-    await engine_logs_manager.connect(websocket, user_id)
+    if not await engine_logs_manager.connect(websocket, user_id):
+        return
     try:
+        try:
+            status = await _load_status(user_id)
+            await engine_logs_manager.send_event(user_id, {"type": "status", **status.model_dump()})
+        except Exception as e:
+            logger.warning("Initial status frame failed", user_id=user_id, error=str(e))
+
         while True:
             data = await websocket.receive_text()
             if data == "ping":
-                await websocket.send_text('{"type": "pong"}')
+                await websocket.send_text(_PONG_FRAME)
     except WebSocketDisconnect:
         pass
     finally:
-        engine_logs_manager.disconnect(user_id)
+        engine_logs_manager.disconnect(user_id, websocket)
@@ -8,52 +8,62 @@ Validates Stripe signature → no forged events possible.
 from __future__ import annotations
 
 import os
+from datetime import datetime, timezone
 
 import stripe
 import structlog
 from fastapi import APIRouter, HTTPException, Request
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from api.websocket_manager import engine_logs_manager
-from db.models import BotInstance, BotStatus, User, UserTier, init_db
-from db.session import get_session
+from db.models import BotInstance, BotStatus, User, UserTier
+from db.session import get_async_session
 
 logger = structlog.get_logger()
 
 router = APIRouter(prefix="/api/stripe", tags=["stripe"])
 
 
-async def _provision_user(customer_email: str, wallet_address: str | None) -> None:
-    """Create or update user after successful payment — sync DB call."""
-    init_db()
+def _upsert(session, model):
+    """INSERT ... ON CONFLICT builder for the session's dialect (Postgres, SQLite in dev)."""
+    insert = pg_insert if session.bind.dialect.name == "postgresql" else sqlite_insert
+    return insert(model)
 
-    with get_session() as session:
-        user = session.query(User).filter(User.email == customer_email).first()
 
-        if not user:
-            user = User(
-                email=customer_email,
-                tier=UserTier.RUNNER,
-                is_active=True,
+async def _provision_user(customer_email: str, wallet_address: str | None) -> None:
+    """Create or update user after successful payment. Tables are created at startup."""
+    async with get_async_session() as session:
+        # Upserts keyed on the unique email / user_id: two round-trips, and
+        # concurrent Stripe redeliveries cannot race into duplicate rows.
+        # ON CONFLICT skips the ORM onupdate hook, so updated_at is set here.
+        now = datetime.now(timezone.utc)
+        stmt = _upsert(session, User).values(
+            email=customer_email,
+            tier=UserTier.RUNNER,
+            is_active=True,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[User.email],
+            set_={
+                "tier": UserTier.RUNNER,
+                "is_active": True,
+                "updated_at": now,
+            },
+        ).returning(User.id)
+        user_id = (await session.execute(stmt)).scalar_one()
+        logger.info("User provisioned as runner", email=_mask(customer_email))
+
+        # Init BotInstance if missing; only reset to IDLE if in ERROR — keep RUNNING if already active
+        stmt = _upsert(session, BotInstance).values(user_id=user_id, status=BotStatus.IDLE)
+        await session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[BotInstance.user_id],
+                set_={"status": BotStatus.IDLE, "updated_at": now},
+                where=BotInstance.status == BotStatus.ERROR,
             )
-            session.add(user)
-            session.flush()
-            logger.info("New user provisioned", email=_mask(customer_email))
-        else:
-            user.tier = UserTier.RUNNER
-            user.is_active = True
-            logger.info("Existing user upgraded to runner", email=_mask(customer_email))
-
-        # Init BotInstance if missing
-        bot = session.query(BotInstance).filter(BotInstance.user_id == user.id).first()
-        if not bot:
-            bot = BotInstance(user_id=user.id, status=BotStatus.IDLE)
-            session.add(bot)
-        else:
-            # Only reset to IDLE if in ERROR — keep RUNNING if already active
-            if bot.status == BotStatus.ERROR:
-                bot.status = BotStatus.IDLE
-
-        user_id = user.id
+        )
 
     # Notify user via WebSocket if connected
     await engine_logs_manager.send_personal_message(
@@ -64,10 +74,10 @@ async def _provision_user(customer_email: str, wallet_address: str | None) -> No
 
 def _mask(email: str) -> str:
     """Mask email for logs — no PII leakage."""
-    parts = email.split("@")
-    if len(parts) != 2:
+    local, sep, domain = email.partition("@")
+    if not sep or "@" in domain:
         return "***"
-    return f"{parts[0][:2]}***@{parts[1]}"
+    return f"{local[:2]}***@{domain}"
 
 
 @router.post("/webhook")
@@ -117,8 +127,10 @@ async def stripe_webhook(request: Request) -> dict:
     elif event_type == "invoice.payment_failed":
         cust_email: str = event["data"]["object"].get("customer_email", "")
         if cust_email:
-            with get_session() as session:
-                user = session.query(User).filter(User.email == cust_email).first()
+            async with get_async_session() as session:
+                user = (
+                    await session.execute(select(User).where(User.email == cust_email))
+                ).scalar_one_or_none()
                 if user:
                     user.is_active = False
                     logger.info("User deactivated (payment failed)", email=_mask(cust_email))
@@ -128,10 +140,12 @@ async def stripe_webhook(request: Request) -> dict:
         subscription = event["data"]["object"]
         stripe_customer_id: str = subscription.get("customer", "")
         if stripe_customer_id:
-            with get_session() as session:
-                user = session.query(User).filter(
-                    User.stripe_customer_id == stripe_customer_id
-                ).first()
+            async with get_async_session() as session:
+                user = (
+                    await session.execute(
+                        select(User).where(User.stripe_customer_id == stripe_customer_id)
+                    )
+                ).scalars().first()
                 if user:
                     user.tier = UserTier.FREE
                     user.is_active = False
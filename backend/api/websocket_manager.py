@@ -3,21 +3,52 @@ Engine Logs WebSocket Manager
 ==============================
 ConnectionManager for streaming worker logs to the Frontend Terminal.
 Maps user_id -> WebSocket for personal message delivery.
+
+Multi-worker: when REDIS_URL is set, frames are published to the user's
+shard channel engine:logs:{user_id % ENGINE_LOG_SHARDS}. Each worker only
+subscribes to the shards of the sockets it holds, so a message reaches the
+user whichever uvicorn worker accepted them without waking every worker.
+
+Each worker accepts at most ENGINE_WS_MAX_CONNECTIONS sockets; beyond that,
+new connections are accepted and then closed with 1013 (try again later).
+The handshake has to complete first: closing before accept() makes the
+server answer HTTP 403 and the client never sees the 1013 code.
 """
 
 from __future__ import annotations
 
 import asyncio
 import json
+import os
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Optional
 
 from fastapi import WebSocket
 
 import structlog
 
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    aioredis = None
+    REDIS_AVAILABLE = False
+
 logger = structlog.get_logger()
 
+CHANNEL_PREFIX = "engine:logs:"
+ENGINE_LOG_SHARDS = int(os.environ.get("ENGINE_LOG_SHARDS", "64"))
+ENGINE_WS_MAX_CONNECTIONS = int(os.environ.get("ENGINE_WS_MAX_CONNECTIONS", "10000"))
+WS_CLOSE_TRY_AGAIN_LATER = 1013
+
+# Micro-batching: frames queued for a user within BATCH_WINDOW are sent as one
+# JSON array frame (a lone frame is sent as-is).
+BATCH_WINDOW = 0.02
+BATCH_MAX_FRAMES = 64
+# Per-user backlog while a send is in flight; a slow client loses its oldest
+# frames rather than growing the queue without bound
+USER_QUEUE_MAX = 1024
+
 
 class EngineLogsManager:
     """
@@ -28,11 +59,161 @@ class EngineLogsManager:
     def __init__(self) -> None:
         self._connections: dict[int, WebSocket] = {}
         self._lock = asyncio.Lock()
+        self._redis: Any = None
+        self._pubsub: Any = None
+        self._pubsub_task: Optional[asyncio.Task] = None
+        self._shard_refs: dict[int, int] = {}
+        self._queues: dict[int, asyncio.Queue[str]] = {}
+        self._pumps: dict[int, asyncio.Task] = {}
+
+    # -------------------------------------------------------------------------
+    # Redis pub/sub fan-out (cross-worker)
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _shard(user_id: int) -> int:
+        return user_id % ENGINE_LOG_SHARDS
+
+    async def start_pubsub(self) -> None:
+        """Enable Redis fan-out if REDIS_URL is configured."""
+        redis_url = os.environ.get("REDIS_URL", "")
+        if not redis_url or not REDIS_AVAILABLE or self._pubsub_task:
+            return
+        try:
+            self._redis = aioredis.Redis.from_url(redis_url, decode_responses=True)
+            await self._redis.ping()
+        except Exception as e:
+            logger.warning("Engine logs pub/sub disabled — Redis unreachable", error=str(e))
+            self._redis = None
+            return
+        self._pubsub = self._redis.pubsub()
+        for shard in {self._shard(uid) for uid in self._connections}:
+            await self._subscribe_shard(shard)
+        self._pubsub_task = asyncio.create_task(self._pubsub_loop())
+        logger.info("Engine logs pub/sub started", shards=ENGINE_LOG_SHARDS)
+
+    async def stop_pubsub(self) -> None:
+        if self._pubsub_task:
+            self._pubsub_task.cancel()
+            try:
+                await self._pubsub_task
+            except asyncio.CancelledError:
+                pass
+            self._pubsub_task = None
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.aclose()
+            except Exception:
+                pass
+            self._pubsub = None
+        self._shard_refs.clear()
+        if self._redis is not None:
+            try:
+                await self._redis.aclose()
+            except Exception:
+                pass
+            self._redis = None
+
+    async def _subscribe_shard(self, shard: int) -> None:
+        self._shard_refs[shard] = self._shard_refs.get(shard, 0) + 1
+        if self._shard_refs[shard] == 1:
+            await self._pubsub.subscribe(f"{CHANNEL_PREFIX}{shard}")
+
+    async def _unsubscribe_shard(self, shard: int) -> None:
+        refs = self._shard_refs.get(shard, 0) - 1
+        if refs > 0:
+            self._shard_refs[shard] = refs
+            return
+        self._shard_refs.pop(shard, None)
+        try:
+            await self._pubsub.unsubscribe(f"{CHANNEL_PREFIX}{shard}")
+        except Exception:
+            pass
 
-    async def connect(self, websocket: WebSocket, user_id: int) -> None:
-        """Accept connection and register for user_id."""
+    async def _pubsub_loop(self) -> None:
+        pubsub = self._pubsub
+        while True:
+            if not pubsub.subscribed:
+                await asyncio.sleep(0.1)
+                continue
+            try:
+                msg = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Engine logs pub/sub read failed", error=str(e))
+                await asyncio.sleep(1.0)
+                continue
+            if not msg or msg.get("type") != "message":
+                continue
+            # Payload: "<user_id>|<json frame>"
+            uid, _, text = msg["data"].partition("|")
+            try:
+                await self._deliver_local(int(uid), text)
+            except ValueError:
+                continue
+
+    async def _deliver_local(self, user_id: int, text: str) -> bool:
+        """Queue a serialized frame for this worker's socket; the pump sends it."""
+        if user_id not in self._connections:
+            return False
+        queue = self._queues.get(user_id)
+        if queue is None:
+            queue = self._queues[user_id] = asyncio.Queue(maxsize=USER_QUEUE_MAX)
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(text)
+        if user_id not in self._pumps:
+            self._pumps[user_id] = asyncio.create_task(self._pump(user_id, queue))
+        return True
+
+    async def _pump(self, user_id: int, queue: asyncio.Queue[str]) -> None:
+        """Drain a user's queue, coalescing frames that arrive within BATCH_WINDOW."""
+        try:
+            while True:
+                frames = [await queue.get()]
+                await asyncio.sleep(BATCH_WINDOW)
+                while not queue.empty() and len(frames) < BATCH_MAX_FRAMES:
+                    frames.append(queue.get_nowait())
+
+                ws = self._connections.get(user_id)
+                if not ws:
+                    return
+                # Frames are already JSON text — join instead of re-encoding
+                text = frames[0] if len(frames) == 1 else "[" + ",".join(frames) + "]"
+                try:
+                    await ws.send_text(text)
+                except Exception as e:
+                    logger.warning("Failed to send log to user", user_id=user_id, error=str(e))
+                    self.disconnect(user_id, ws)
+                    return
+        finally:
+            if self._pumps.get(user_id) is asyncio.current_task():
+                self._pumps.pop(user_id, None)
+
+    async def _send(self, user_id: int, text: str) -> bool:
+        """Route a serialized frame: via Redis when fanning out, else direct."""
+        if self._pubsub_task is not None:
+            try:
+                await self._redis.publish(f"{CHANNEL_PREFIX}{self._shard(user_id)}", f"{user_id}|{text}")
+                return True
+            except Exception as e:
+                logger.warning("Engine logs publish failed — sending locally", error=str(e))
+        return await self._deliver_local(user_id, text)
+
+    async def connect(self, websocket: WebSocket, user_id: int) -> bool:
+        """
+        Accept connection and register for user_id.
+        Returns False (socket closed with 1013) when this worker is at capacity;
+        the socket is accepted first so the close code reaches the client.
+        """
         await websocket.accept()
 
+        if user_id not in self._connections and len(self._connections) >= ENGINE_WS_MAX_CONNECTIONS:
+            logger.warning("Engine logs WebSocket rejected — at capacity", user_id=user_id)
+            await websocket.close(code=WS_CLOSE_TRY_AGAIN_LATER, reason="capacity")
+            return False
+
         async with self._lock:
             # Replace existing connection if any
             old = self._connections.pop(user_id, None)
@@ -42,36 +223,56 @@ class EngineLogsManager:
                 except Exception:
                     pass
             self._connections[user_id] = websocket
+            if not old and self._pubsub is not None:
+                await self._subscribe_shard(self._shard(user_id))
 
         logger.info("Engine logs WebSocket connected", user_id=user_id)
+        return True
 
-    def disconnect(self, user_id: int) -> None:
-        """Remove connection for user_id."""
-        self._connections.pop(user_id, None)
+    def disconnect(self, user_id: int, websocket: WebSocket) -> None:
+        """
+        Remove websocket for user_id.
+
+        No-op when user_id has since reconnected on another socket: the
+        replaced socket's handler must not tear down the live one.
+        """
+        if self._connections.get(user_id) is not websocket:
+            return
+        del self._connections[user_id]
+        if self._pubsub is not None:
+            asyncio.create_task(self._unsubscribe_shard(self._shard(user_id)))
+        self._queues.pop(user_id, None)
+        pump = self._pumps.pop(user_id, None)
+        if pump and pump is not asyncio.current_task():
+            pump.cancel()
         logger.info("Engine logs WebSocket disconnected", user_id=user_id)
 
     async def send_personal_message(self, message: str, user_id: int) -> bool:
         """
         Send a log message to a specific user's WebSocket.
-        Returns True if sent, False if user not connected.
+        Returns True if queued for delivery, False if user not connected.
         """
-        ws = self._connections.get(user_id)
-        if not ws:
+        if self._pubsub_task is None and user_id not in self._connections:
             return False
 
-        try:
-            payload = {
-                "type": "log",
-                "message": message,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-            }
-            await ws.send_text(json.dumps(payload))
-            return True
-        except Exception as e:
-            logger.warning("Failed to send log to user", user_id=user_id, error=str(e))
-            self.disconnect(user_id)
+        payload = {
+            "type": "log",
+            "message": message,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+        return await self._send(user_id, json.dumps(payload))
+
+    async def send_event(self, user_id: int, event: dict) -> bool:
+        """
+        Send a structured (non-log) frame, e.g. {"type": "status_delta", ...}.
+        Returns True if queued for delivery, False if user not connected.
+        """
+        if self._pubsub_task is None and user_id not in self._connections:
             return False
 
+        payload = {**event, "timestamp": datetime.now(timezone.utc).isoformat()}
+        return await self._send(user_id, json.dumps(payload))
+
     def is_connected(self, user_id: int) -> bool:
         """Check if user has an active connection."""
         return user_id in self._connections
@@ -19,9 +19,12 @@ from sqlalchemy import (
     Float,
     ForeignKey,
     Index,
+    Integer,
     String,
     Text,
     create_engine,
+    inspect,
+    text,
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
@@ -202,6 +205,8 @@ class BotInstance(Base):
     last_heartbeat: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     current_pnl: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
     last_log: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Denormalized COUNT(trade_logs) — incremented in the same transaction as each TradeLog insert
+    total_trades_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -232,7 +237,8 @@ class TradeLog(Base):
     __tablename__ = "trade_logs"
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    # Indexed via ix_trade_logs_user_executed_desc (user_id is its leading column)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
 
     market_id: Mapped[str] = mapped_column(String(128), nullable=False, index=True)
     market_question: Mapped[str] = mapped_column(Text, default="", nullable=False)
@@ -256,9 +262,10 @@ class TradeLog(Base):
 
     user: Mapped["User"] = relationship("User", back_populates="trade_logs")
 
-    __table_args__ = (
-        Index("ix_trade_logs_user_executed", "user_id", "executed_at"),
-    )
+
+# Serves /api/engine/trades (WHERE user_id ORDER BY executed_at DESC LIMIT n)
+# as a bounded index scan, and the per-user COUNT(*) on /status.
+Index("ix_trade_logs_user_executed_desc", TradeLog.user_id, TradeLog.executed_at.desc())
 
 
 # -----------------------------------------------------------------------------
@@ -336,7 +343,36 @@ def _get_engine_url() -> str:
     return f"sqlite:///{data_dir / 'blackedge.db'}"
 
 
+# Superseded by ix_trade_logs_user_executed_desc (user_id is its leading column)
+_REPLACED_INDEXES = ("ix_trade_logs_user_executed", "ix_trade_logs_user_id")
+
+
 def init_db() -> None:
-    """Create all tables if they don't exist."""
+    """Create all tables (and any indexes added since) if they don't exist."""
     engine = create_engine(_get_engine_url(), echo=False)
     Base.metadata.create_all(engine)
+    # create_all skips indexes on tables that already exist
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+    # ...and never drops the ones they replaced
+    with engine.begin() as conn:
+        for name in _REPLACED_INDEXES:
+            conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+    _add_missing_columns(engine)
+    engine.dispose()
+
+
+def _add_missing_columns(engine) -> None:
+    """Lightweight migration for columns added after the first deploy."""
+    columns = {c["name"] for c in inspect(engine).get_columns("bot_instances")}
+    if "total_trades_count" in columns:
+        return
+    with engine.begin() as conn:
+        conn.execute(text(
+            "ALTER TABLE bot_instances ADD COLUMN total_trades_count INTEGER NOT NULL DEFAULT 0"
+        ))
+        conn.execute(text(
+            "UPDATE bot_instances SET total_trades_count = "
+            "(SELECT COUNT(*) FROM trade_logs WHERE trade_logs.user_id = bot_instances.user_id)"
+        ))
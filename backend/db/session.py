@@ -6,12 +6,14 @@ Sync session for startup/migrations, async session for request handlers.
 
 from __future__ import annotations
 
+import os
 from contextlib import asynccontextmanager, contextmanager
-from typing import AsyncGenerator, Generator
+from typing import Any, AsyncGenerator, Generator
 
 from sqlalchemy import create_engine
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
 
 from .models import Base, _get_engine_url
 
@@ -20,6 +22,32 @@ _SessionLocal = None
 _async_engine = None
 _AsyncSessionLocal = None
 
+# ── Pool tuning (env-overridable) ────────────────────────────────────────────
+DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = int(os.environ.get("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.environ.get("DB_POOL_RECYCLE", "3600"))
+# LIFO reuses the most recently returned (warm) connection and lets idle
+# overflow connections age out after a burst
+DB_POOL_USE_LIFO = os.environ.get("DB_POOL_USE_LIFO", "true").lower() == "true"
+# PgBouncer in transaction-pooling mode already pools — don't pool twice
+DB_USE_PGBOUNCER = os.environ.get("DB_USE_PGBOUNCER", "false").lower() == "true"
+
+
+def _pool_kwargs(url: str, max_overflow: int = DB_MAX_OVERFLOW) -> dict[str, Any]:
+    """Connection pool options for create_engine / create_async_engine."""
+    if DB_USE_PGBOUNCER:
+        return {"poolclass": NullPool}
+    kwargs: dict[str, Any] = {"pool_pre_ping": True, "pool_recycle": DB_POOL_RECYCLE}
+    if not url.startswith("sqlite"):
+        kwargs.update(
+            pool_size=DB_POOL_SIZE,
+            max_overflow=max_overflow,
+            pool_timeout=DB_POOL_TIMEOUT,
+            pool_use_lifo=DB_POOL_USE_LIFO,
+        )
+    return kwargs
+
 
 # ---------------------------------------------------------------------------
 # Sync (used for init_db, migrations, CLI)
@@ -28,7 +56,8 @@ _AsyncSessionLocal = None
 def get_engine():
     global _engine
     if _engine is None:
-        _engine = create_engine(_get_engine_url(), echo=False)
+        url = _get_engine_url()
+        _engine = create_engine(url, echo=False, **_pool_kwargs(url))
     return _engine
 
 
@@ -71,13 +100,8 @@ def _get_async_engine_url() -> str:
 def get_async_engine():
     global _async_engine
     if _async_engine is None:
-        _async_engine = create_async_engine(
-            _get_async_engine_url(),
-            echo=False,
-            pool_pre_ping=True,
-            pool_size=20,
-            max_overflow=40,
-        )
+        url = _get_async_engine_url()
+        _async_engine = create_async_engine(url, echo=False, **_pool_kwargs(url, max_overflow=40))
     return _async_engine
 
 
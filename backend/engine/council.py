@@ -5,6 +5,7 @@ This is the CORE of Black Edge. Without this, we have no product.
 
 import asyncio
 import time
+import orjson
 import structlog
 from dataclasses import dataclass
 from typing import Optional
@@ -44,6 +45,13 @@ class CouncilAI:
     def __init__(self):
         self._cache: dict[str, CouncilDecision] = {}
         self._cache_ttl = 300  # 5 min cache per market
+        # Bumped on every decision write; the serialized /council payload is
+        # rebuilt only when this moves or the oldest decision ages out.
+        self._cached_payload_ver = 0
+        self._cached_payload_built_ver = -1
+        self._cached_payload_expires = 0.0
+        self._cached_payload_bytes = b"[]"
+        self._cached_payload_total = 0
 
     async def analyze_market(self, market: dict) -> CouncilDecision:
         market_id = market.get("conditionId", market.get("id", ""))
@@ -70,6 +78,7 @@ class CouncilAI:
 
         decision = self._judge(market_id, question, yes_price, list(votes))
         self._cache[market_id] = decision
+        self._cached_payload_ver += 1
 
         logger.info(
             "Council decision",
@@ -333,3 +342,29 @@ class CouncilAI:
     def get_all_cached(self) -> dict:
         now = time.time()
         return {k: v for k, v in self._cache.items() if now - v.timestamp < self._cache_ttl}
+
+    def get_all_cached_payload(self) -> tuple[bytes, int]:
+        """Active decisions as a serialized JSON array, plus their count."""
+        now = time.time()
+        if self._cached_payload_built_ver != self._cached_payload_ver or now >= self._cached_payload_expires:
+            live = self.get_all_cached()
+            self._cached_payload_bytes = orjson.dumps([
+                {
+                    "market_id": d.market_id,
+                    "question": d.market_question,
+                    "signal": d.final_signal,
+                    "edge": d.edge,
+                    "confidence": d.final_confidence,
+                    "consensus_pct": d.consensus_pct,
+                    "doomer_veto": d.doomer_veto,
+                    "summary": d.summary,
+                }
+                for d in live.values()
+            ])
+            self._cached_payload_total = len(live)
+            self._cached_payload_built_ver = self._cached_payload_ver
+            self._cached_payload_expires = min(
+                (d.timestamp + self._cache_ttl for d in live.values()),
+                default=float("inf"),
+            )
+        return self._cached_payload_bytes, self._cached_payload_total
@@ -69,6 +69,18 @@ class CryptoShortTermMarket:
     is_live: bool                  # Currently in trading window
     time_remaining_seconds: float  # Seconds until resolution
 
+    def to_api_dict(self) -> dict:
+        """Serialize for the /api/v2/crypto/5min/signals JSON response."""
+        return {
+            "slug": self.slug,
+            "question": self.question,
+            "interval": self.interval_minutes,
+            "upPrice": round(self.up_price, 3),
+            "downPrice": round(self.down_price, 3),
+            "timeRemaining": round(self.time_remaining_seconds),
+            "volume": round(self.volume, 2),
+        }
+
 
 @dataclass
 class LatencySignal:
@@ -87,6 +99,24 @@ class LatencySignal:
     volume: float                  # Market volume in USDC
     timestamp: float
 
+    def to_api_dict(self) -> dict:
+        """Serialize for the /api/v2/crypto/5min/signals JSON response."""
+        return {
+            "market": self.market_slug,
+            "slug": self.market_slug,
+            "question": self.question,
+            "direction": self.direction,
+            "btcMove": round(self.binance_move_pct, 3),
+            "marketPrice": round(self.polymarket_up_price, 3),
+            "trueProbability": round(self.estimated_true_prob, 3),
+            "edge": round(self.edge, 3),
+            "confidence": self.confidence,
+            "timeRemaining": round(self.time_remaining_seconds),
+            "recommendedSide": self.recommended_side,
+            "tokenId": self.recommended_token_id,
+            "volume": round(self.volume, 2),
+        }
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # MAIN SCANNER
@@ -112,6 +142,10 @@ class Crypto5MinScanner:
         self._client: Optional[httpx.AsyncClient] = None
         self._last_request_time: float = 0.0
         self._active_markets: list[CryptoShortTermMarket] = []
+        # API projections, built once per discovery/scan rather than per request
+        self.api_markets: list[dict] = []
+        self.api_signals: list[dict] = []
+        self.last_scan_monotonic: float = 0.0
         self._btc_price: float = 0.0
         self._btc_price_time: float = 0.0
         # Cache of interval start prices: {unix_timestamp: btc_price}
@@ -328,6 +362,7 @@ class Crypto5MinScanner:
 
         # Filter to only live markets with time remaining
         self._active_markets = [m for m in markets if m.is_live and m.time_remaining_seconds > 30]
+        self.api_markets = [m.to_api_dict() for m in self._active_markets]
 
         if self._active_markets:
             logger.info(
@@ -393,6 +428,8 @@ class Crypto5MinScanner:
         # Get current BTC price
         current_price = await self.fetch_btc_price()
         if current_price == 0:
+            self.api_signals = []
+            self.last_scan_monotonic = time.monotonic()
             return signals
 
         for market in self._active_markets:
@@ -469,6 +506,8 @@ class Crypto5MinScanner:
 
         # Sort by edge descending
         signals.sort(key=lambda s: s.edge, reverse=True)
+        self.api_signals = [s.to_api_dict() for s in signals]
+        self.last_scan_monotonic = time.monotonic()
 
         if signals:
             logger.info(
@@ -6,8 +6,11 @@ les headlines entrantes contre cet index.
 """
 
 import re
+from collections import defaultdict
 from dataclasses import dataclass
 
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
 
 @dataclass
 class MarketMatch:
@@ -36,24 +39,35 @@ class MarketMatcher:
     def __init__(self):
         self._market_keywords: dict[str, set[str]] = {}  # market_id → keywords
         self._market_questions: dict[str, str] = {}       # market_id → question
+        self._keyword_index: dict[str, list[int]] = {}    # keyword → market positions
+        self._market_ids: list[str] = []                  # position → market_id
+        self._indexed_markets: list | None = None         # list the index was built from
 
     def update_markets(self, markets: list) -> None:
         """
         Update the keyword index from active Polymarket markets.
         Call this every time markets are refreshed.
 
+        PolymarketClient swaps its cached list wholesale on refresh, so
+        passing the same list object again is a no-op.
+
         Args:
             markets: List of PolymarketMarket objects
         """
+        if markets is self._indexed_markets:
+            return
+        self._indexed_markets = markets
+
         self._market_keywords.clear()
         self._market_questions.clear()
+        index: dict[str, list[int]] = defaultdict(list)
 
         for market in markets:
             market_id = market.id
             question = market.question
 
             # Extract keywords
-            words = re.findall(r'[a-z0-9]+', question.lower())
+            words = _TOKEN_RE.findall(question.lower())
             keywords = {w for w in words if w not in self.STOP_WORDS and len(w) > 2}
 
             # Add important bigrams (ex: "super bowl", "rate cut")
@@ -70,6 +84,14 @@ class MarketMatcher:
             self._market_keywords[market_id] = keywords
             self._market_questions[market_id] = question
 
+        # Inverted index over the final keyword sets (a repeated market_id
+        # keeps its last question, like the dicts above)
+        self._market_ids = list(self._market_keywords)
+        for pos, keywords in enumerate(self._market_keywords.values()):
+            for keyword in keywords:
+                index[keyword].append(pos)
+        self._keyword_index = dict(index)
+
     def match_headline(self, headline: str, min_score: float = 0.3) -> list[MarketMatch]:
         """
         Match a headline against all active markets.
@@ -81,30 +103,49 @@ class MarketMatcher:
         Returns:
             List of MarketMatch, sorted by score descending
         """
-        headline_words = set(re.findall(r'[a-z0-9]+', headline.lower()))
-
-        matches = []
-        for market_id, market_keywords in self._market_keywords.items():
-            if not market_keywords:
-                continue
+        return self.match_headlines_batch([headline], min_score)[0]
 
-            # Find matching keywords
-            common = headline_words & market_keywords
+    def match_headlines_batch(self, headlines: list[str], min_score: float = 0.3) -> list[list[MarketMatch]]:
+        """
+        Match many headlines in one pass over the keyword index.
 
-            if not common:
-                continue
+        Only markets sharing at least one keyword with a headline are
+        scored, instead of every market for every headline.
 
-            score = len(common) / len(market_keywords)
+        Args:
+            headlines: News headline texts
+            min_score: Minimum match score (0.0 - 1.0)
 
-            if score >= min_score:
-                matches.append(MarketMatch(
-                    market_id=market_id,
-                    market_question=self._market_questions[market_id],
+        Returns:
+            One list of MarketMatch per headline, sorted by score descending
+        """
+        index = self._keyword_index
+        market_ids = self._market_ids
+        market_keywords = self._market_keywords
+
+        results = []
+        for headline in headlines:
+            common: dict[int, list[str]] = defaultdict(list)
+            for word in set(_TOKEN_RE.findall(headline.lower())):
+                for pos in index.get(word, ()):
+                    common[pos].append(word)
+
+            scored = []
+            for pos, words in common.items():
+                score = len(words) / len(market_keywords[market_ids[pos]])
+                if score >= min_score:
+                    scored.append((score, pos, words))
+
+            # Score descending, ties in market order
+            scored.sort(key=lambda x: (-x[0], x[1]))
+            results.append([
+                MarketMatch(
+                    market_id=market_ids[pos],
+                    market_question=self._market_questions[market_ids[pos]],
                     match_score=score,
-                    matched_keywords=list(common),
-                ))
-
-        # Sort by score
-        matches.sort(key=lambda x: x.match_score, reverse=True)
+                    matched_keywords=words,
+                )
+                for score, pos, words in scored
+            ])
 
-        return matches
+        return results
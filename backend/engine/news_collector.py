@@ -16,8 +16,11 @@ import structlog
 
 logger = structlog.get_logger()
 
+# How long an API-facing collect_all() result is reused before re-fetching
+RECENT_CACHE_MAX_AGE = 30.0
 
-@dataclass
+
+@dataclass(slots=True)
 class NewsItem:
     """A single news item from any source."""
     title: str
@@ -42,6 +45,9 @@ class NewsCollector:
         self._cryptopanic_token = cryptopanic_token
         self._seen_urls: set[str] = set()  # Déduplication
         self._last_fetch: dict[str, float] = {}  # Rate limiting par source
+        # Résultats récents par jeu de questions: key -> (monotonic fetched_at, items)
+        self._recent: dict[tuple, tuple[float, list[NewsItem]]] = {}
+        self._recent_inflight: dict[tuple, asyncio.Task] = {}
 
     async def _get_client(self) -> httpx.AsyncClient:
         if self._client is None or self._client.is_closed:
@@ -303,34 +309,41 @@ class NewsCollector:
         Returns:
             Liste de NewsItem dédupliquées, triées par date
         """
-        all_items: list[NewsItem] = []
+        # Chaque groupe de sources part en parallèle. Les appels qui partagent
+        # une clé de rate limit (Google News par query, CryptoPanic) restent
+        # séquentiels dans leur groupe; topics et subreddits ont chacun leur clé.
 
         # 1. Google News par catégorie (headlines générales)
         topics = ["WORLD", "NATION", "BUSINESS", "TECHNOLOGY", "SPORTS"]
-        for topic in topics:
-            items = await self.fetch_google_news_topic(topic, max_results=5)
-            all_items.extend(items)
 
         # 2. Google News par query liée aux marchés actifs
-        if market_questions:
-            # Extraire les keywords des 10 premiers marchés
-            for question in market_questions[:10]:
-                keywords = self._extract_search_query(question)
-                if keywords:
-                    items = await self.fetch_google_news(keywords, max_results=5)
-                    all_items.extend(items)
+        async def fetch_market_queries() -> list[NewsItem]:
+            items: list[NewsItem] = []
+            if market_questions:
+                # Extraire les keywords des 10 premiers marchés
+                for question in market_questions[:10]:
+                    keywords = self._extract_search_query(question)
+                    if keywords:
+                        items.extend(await self.fetch_google_news(keywords, max_results=5))
+            return items
 
         # 3. CryptoPanic (hot + rising)
-        items = await self.fetch_cryptopanic("hot", max_results=10)
-        all_items.extend(items)
-        items = await self.fetch_cryptopanic("rising", max_results=10)
-        all_items.extend(items)
+        async def fetch_cryptopanic_feeds() -> list[NewsItem]:
+            items = await self.fetch_cryptopanic("hot", max_results=10)
+            items.extend(await self.fetch_cryptopanic("rising", max_results=10))
+            return items
 
         # 4. Reddit (subreddits pertinents)
         subreddits = ["polymarket", "cryptocurrency", "politics", "worldnews", "sportsbetting"]
-        for sub in subreddits:
-            items = await self.fetch_reddit(sub, max_results=10)
-            all_items.extend(items)
+
+        batches = await asyncio.gather(
+            *(self.fetch_google_news_topic(topic, max_results=5) for topic in topics),
+            fetch_market_queries(),
+            fetch_cryptopanic_feeds(),
+            *(self.fetch_reddit(sub, max_results=10) for sub in subreddits),
+        )
+        # Même ordre de concaténation qu'en séquentiel
+        all_items: list[NewsItem] = [item for batch in batches for item in batch]
 
         # Trier par date (plus récent en premier)
         all_items.sort(key=lambda x: x.published_ms, reverse=True)
@@ -351,6 +364,40 @@ class NewsCollector:
 
         return all_items
 
+    async def get_recent_cached(
+        self,
+        market_questions: list[str] = None,
+        max_age_s: float = RECENT_CACHE_MAX_AGE,
+    ) -> list[NewsItem]:
+        """
+        collect_all() avec cache court et singleflight.
+
+        Tous les appelants concurrents pour les mêmes questions partagent une
+        seule collecte en cours. Le résultat est partagé: ne pas le modifier.
+        """
+        key = tuple(market_questions) if market_questions else ()
+        hit = self._recent.get(key)
+        if hit is not None and time.monotonic() - hit[0] < max_age_s:
+            return hit[1]
+
+        task = self._recent_inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._collect_recent(key, market_questions))
+            self._recent_inflight[key] = task
+            task.add_done_callback(lambda _t, k=key: self._recent_inflight.pop(k, None))
+        # shield: a cancelled caller must not cancel the collection others await
+        return await asyncio.shield(task)
+
+    async def _collect_recent(self, key: tuple, market_questions: list[str] | None) -> list[NewsItem]:
+        items = await self.collect_all(market_questions=market_questions)
+        now = time.monotonic()
+        # Les questions de marché tournent: purger les entrées périmées
+        self._recent = {
+            k: v for k, v in self._recent.items() if now - v[0] < RECENT_CACHE_MAX_AGE
+        }
+        self._recent[key] = (now, items)
+        return items
+
     # ─── HELPERS ───
 
     @staticmethod
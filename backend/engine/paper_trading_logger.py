@@ -8,6 +8,7 @@ Database: SQLite (migrations to Postgres later)
 Auto-resolution: Checks Polymarket API for market resolution
 """
 
+import asyncio
 import sqlite3
 import json
 import time
@@ -23,6 +24,16 @@ logger = structlog.get_logger()
 DB_PATH = Path(__file__).parent.parent / "data" / "paper_trading.db"
 DB_PATH.parent.mkdir(parents=True, exist_ok=True)
 
+# get_track_record() result, dropped on every write from this process.
+# The TTL bounds staleness when another worker process writes the DB.
+TRACK_RECORD_CACHE_TTL = 30.0
+_track_record_cache: Optional[tuple[float, Dict]] = None
+
+
+def _invalidate_track_record() -> None:
+    global _track_record_cache
+    _track_record_cache = None
+
 
 # =============================================================================
 # DATA STRUCTURES
@@ -191,6 +202,7 @@ def log_prediction(
 
         conn.commit()
         trade_id = cursor.lastrowid
+        _invalidate_track_record()
 
         logger.info(
             "📝 Paper trade logged",
@@ -290,6 +302,7 @@ def resolve_prediction(
 
     conn.commit()
     conn.close()
+    _invalidate_track_record()
 
     logger.info(
         "✅ Prediction resolved",
@@ -310,9 +323,24 @@ def get_track_record() -> Dict:
     """
     Get complete track record statistics.
 
+    Served from cache until the next logged or resolved prediction
+    (or TRACK_RECORD_CACHE_TTL), instead of re-running the aggregate
+    queries on every call.
+
     Returns:
         Dict with performance metrics
     """
+    global _track_record_cache
+    cached = _track_record_cache
+    if cached is not None and time.monotonic() - cached[0] < TRACK_RECORD_CACHE_TTL:
+        return dict(cached[1])
+
+    stats = _compute_track_record()
+    _track_record_cache = (time.monotonic(), stats)
+    return dict(stats)
+
+
+def _compute_track_record() -> Dict:
     conn = sqlite3.connect(DB_PATH)
     cursor = conn.cursor()
 
@@ -479,76 +507,104 @@ def get_open_positions_for_api() -> List[Dict]:
 # AUTO-RESOLUTION (TODO: Implement with Polymarket API)
 # =============================================================================
 
-async def auto_resolve_predictions(polymarket_client):
+# Concurrent resolution writes; SQLite serializes them, this bounds the waiters
+AUTO_RESOLVE_CONCURRENCY = 10
+
+
+def _closed_market_outcome(trade: Dict, market) -> Optional[tuple[str, float]]:
+    """(outcome, exit_price) for a closed market, or None if it cannot be resolved yet."""
+    if market.active:
+        return None
+
+    # Market is closed, try to determine outcome
+    # The side with higher final price (close to 1.0) is the winner
+    if market.yes_price > 0.9:
+        return "YES", market.yes_price
+    if market.no_price > 0.9:
+        return "NO", market.no_price
+
+    # Unclear resolution, skip for now
+    logger.warning(
+        "Market closed but unclear outcome",
+        market_id=trade["market_id"],
+        yes_price=market.yes_price,
+        no_price=market.no_price,
+    )
+    return None
+
+
+async def auto_resolve_predictions(polymarket_client) -> int:
     """
     Check unresolved predictions and resolve them via Polymarket API.
 
     This should be called periodically (e.g., every hour).
 
+    Markets missing from the client cache are fetched once for the whole
+    batch, and resolution writes run concurrently in worker threads.
+
     Args:
         polymarket_client: PolymarketClient instance for fetching market data
+
+    Returns:
+        Number of predictions resolved
     """
-    unresolved = get_unresolved_predictions()
+    unresolved = await asyncio.to_thread(get_unresolved_predictions)
 
     if not unresolved:
-        return
+        return 0
 
     logger.info(f"🔍 Checking {len(unresolved)} unresolved predictions")
 
-    resolved_count = 0
-    for trade in unresolved:
-        # Skip if too recent (< 1 hour old)
-        if time.time() - trade["timestamp"] < 3600:
-            continue
+    # Skip if too recent (< 1 hour old)
+    now = time.time()
+    candidates = [trade for trade in unresolved if now - trade["timestamp"] >= 3600]
 
+    # Check if market exists in cache, else fetch fresh data once for all trades
+    markets = {trade["id"]: polymarket_client.get_market_by_id(trade["market_id"]) for trade in candidates}
+    if any(market is None for market in markets.values()):
         try:
-            # Check if market exists in cache or fetch fresh data
-            market = polymarket_client.get_market_by_id(trade["market_id"])
-
-            if not market:
-                # Try fetching fresh data
-                markets = await polymarket_client.fetch_markets(max_markets=100)
-                market = next((m for m in markets if m.id == trade["market_id"] or m.condition_id == trade["market_id"]), None)
-
-            if not market:
-                logger.debug("Market not found in cache", market_id=trade["market_id"])
-                continue
-
-            # Check if market is closed (resolved)
-            if not market.active:
-                # Market is closed, try to determine outcome
-                # The side with higher final price (close to 1.0) is the winner
-                if market.yes_price > 0.9:
-                    outcome = "YES"
-                    exit_price = market.yes_price
-                elif market.no_price > 0.9:
-                    outcome = "NO"
-                    exit_price = market.no_price
-                else:
-                    # Unclear resolution, skip for now
-                    logger.warning(
-                        "Market closed but unclear outcome",
-                        market_id=trade["market_id"],
-                        yes_price=market.yes_price,
-                        no_price=market.no_price,
-                    )
-                    continue
-
-                # Resolve the prediction
-                success = resolve_prediction(
+            fresh = await polymarket_client.fetch_markets(max_markets=100)
+        except Exception as e:
+            logger.error("Failed to fetch markets for auto-resolution", error=str(e))
+            fresh = []
+        for trade in candidates:
+            if markets[trade["id"]] is None:
+                markets[trade["id"]] = next(
+                    (m for m in fresh if m.id == trade["market_id"] or m.condition_id == trade["market_id"]),
+                    None,
+                )
+
+    semaphore = asyncio.Semaphore(AUTO_RESOLVE_CONCURRENCY)
+
+    async def resolve_one(trade: Dict) -> bool:
+        market = markets[trade["id"]]
+        if not market:
+            logger.debug("Market not found in cache", market_id=trade["market_id"])
+            return False
+
+        try:
+            resolution = _closed_market_outcome(trade, market)
+            if resolution is None:
+                return False
+            outcome, exit_price = resolution
+
+            # Resolve the prediction
+            async with semaphore:
+                success = await asyncio.to_thread(
+                    resolve_prediction,
                     trade_id=trade["id"],
                     actual_outcome=outcome,
                     exit_price=exit_price,
                 )
 
-                if success:
-                    resolved_count += 1
-                    logger.info(
-                        "✅ Auto-resolved prediction",
-                        trade_id=trade["id"],
-                        market=trade["market_question"][:50],
-                        outcome=outcome,
-                    )
+            if success:
+                logger.info(
+                    "✅ Auto-resolved prediction",
+                    trade_id=trade["id"],
+                    market=trade["market_question"][:50],
+                    outcome=outcome,
+                )
+            return success
 
         except Exception as e:
             logger.error(
@@ -556,6 +612,10 @@ async def auto_resolve_predictions(polymarket_client):
                 trade_id=trade["id"],
                 error=str(e),
             )
+            return False
+
+    results = await asyncio.gather(*(resolve_one(trade) for trade in candidates))
+    resolved_count = sum(results)
 
     if resolved_count > 0:
         logger.info(f"📊 Auto-resolved {resolved_count} predictions")
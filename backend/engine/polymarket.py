@@ -12,6 +12,7 @@ from dataclasses import dataclass, field
 from typing import Callable, Awaitable
 
 import httpx
+import orjson
 import structlog
 
 try:
@@ -25,6 +26,8 @@ except ImportError:
 logger = structlog.get_logger()
 
 CLOB_BASE = "https://clob.polymarket.com"
+# Tokens per POST /prices request
+CLOB_PRICES_BATCH = 50
 GAMMA_BASE = "https://gamma-api.polymarket.com"
 WS_BASE = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
 
@@ -68,12 +71,33 @@ def _parse_clob_token_ids(clob_token_ids) -> list[str]:
 
     return []
 
-# Minimum 2s between requests to avoid rate limits
+# Minimum 2s between Gamma requests to avoid rate limits
 MIN_REQUEST_INTERVAL = 2.0
 
+# CLOB reads (books, prices) use a token bucket instead: bursts of up to
+# CLOB_BURST requests go straight out, then CLOB_RATE per second. Past
+# CLOB_MAX_WAITERS queued callers a read fails fast rather than queueing.
+CLOB_RATE = 5.0
+CLOB_BURST = 10
+CLOB_MAX_WAITERS = 20
+
 # Only show markets with meaningful volume
 MIN_VOLUME_USD = 10_000
 
+# Parsed books are reused for about one CLOB book tick
+ORDERBOOK_CACHE_TTL = 2.0
+
+
+def _parse_book_side(raw_levels: list) -> tuple[list[dict], float]:
+    """Parse CLOB book levels to {price, size} dicts, summing size in the same pass."""
+    levels = []
+    total = 0.0
+    for o in raw_levels:
+        size = float(o.get("size", 0))
+        levels.append({"price": float(o.get("price", 0)), "size": size})
+        total += size
+    return levels, total
+
 
 @dataclass
 class PolymarketToken:
@@ -125,8 +149,17 @@ class PolymarketClient:
     def __init__(self) -> None:
         self._client: httpx.AsyncClient | None = None
         self._last_request_time: float = 0.0
+        self._clob_tokens: float = float(CLOB_BURST)
+        self._clob_refill_time: float = time.monotonic()
+        self._clob_waiters: int = 0
         self._cache: list[PolymarketMarket] = []
         self._cache_time: float = 0.0
+        self._by_id: dict[str, PolymarketMarket] = {}  # id and condition_id → market
+        self._book_cache: dict[str, tuple[float, dict]] = {}  # token_id → (expires, book)
+        self._book_inflight: dict[str, asyncio.Task] = {}
+        # (market list, (volume, liquidity, avg spread)); fetch_markets swaps the list
+        # wholesale, WS price updates reset the list to None since they move spreads
+        self._cache_totals: tuple[list | None, tuple[float, float, float]] = (None, (0.0, 0.0, 0.0))
 
         # WebSocket state
         self._ws_connection = None
@@ -152,6 +185,33 @@ class PolymarketClient:
             await asyncio.sleep(MIN_REQUEST_INTERVAL - elapsed)
         self._last_request_time = time.monotonic()
 
+    async def _clob_rate_limit(self) -> bool:
+        """
+        Token bucket for CLOB reads.
+
+        Takes a token, sleeping off any deficit at CLOB_RATE. Returns False
+        without waiting when CLOB_MAX_WAITERS callers are already queued.
+        """
+        now = time.monotonic()
+        self._clob_tokens = min(
+            float(CLOB_BURST),
+            self._clob_tokens + (now - self._clob_refill_time) * CLOB_RATE,
+        )
+        self._clob_refill_time = now
+        if self._clob_tokens >= 1.0:
+            self._clob_tokens -= 1.0
+            return True
+        if self._clob_waiters >= CLOB_MAX_WAITERS:
+            return False
+        # Reserve the token now (the balance goes negative) and wait for it to refill
+        self._clob_tokens -= 1.0
+        self._clob_waiters += 1
+        try:
+            await asyncio.sleep(-self._clob_tokens / CLOB_RATE)
+        finally:
+            self._clob_waiters -= 1
+        return True
+
     async def close(self) -> None:
         # Close WebSocket connection
         if self._ws_task:
@@ -202,7 +262,9 @@ class PolymarketClient:
                 },
             )
             resp.raise_for_status()
-            data = resp.json()
+            # orjson decodes the raw body directly; this page is the largest
+            # payload the client parses
+            data = orjson.loads(resp.content)
 
             # Additional client-side filtering to ensure we only get active markets
             active_markets = []
@@ -251,7 +313,8 @@ class PolymarketClient:
 
     async def _fetch_clob_price(self, token_id: str) -> float | None:
         """Fetch midpoint price for a token from the CLOB."""
-        await self._rate_limit()
+        if not await self._clob_rate_limit():
+            return None
         client = await self._get_client()
 
         try:
@@ -266,17 +329,26 @@ class PolymarketClient:
             return None
 
     async def _fetch_clob_prices_batch(self, token_ids: list[str]) -> dict[str, float]:
-        """Fetch prices for multiple tokens. Returns {token_id: price}."""
-        await self._rate_limit()
+        """Fetch BUY prices for up to CLOB_PRICES_BATCH tokens in one POST /prices."""
+        if not await self._clob_rate_limit():
+            logger.warning("CLOB batch price fetch skipped, rate limit queue full")
+            return {}
         client = await self._get_client()
 
         try:
-            resp = await client.get(
+            resp = await client.post(
                 f"{CLOB_BASE}/prices",
-                params={"token_ids": ",".join(token_ids)},
+                json=[{"token_id": tid, "side": "BUY"} for tid in token_ids],
             )
             resp.raise_for_status()
-            return {k: float(v) for k, v in resp.json().items()}
+            prices = {}
+            # {token_id: {"BUY": "0.52"}}; tolerate a bare price value too
+            for token_id, value in resp.json().items():
+                if isinstance(value, dict):
+                    value = value.get("BUY", value.get("buy"))
+                if value is not None:
+                    prices[token_id] = float(value)
+            return prices
         except Exception as e:
             logger.warning("CLOB batch price fetch failed", error=str(e))
             return {}
@@ -285,17 +357,25 @@ class PolymarketClient:
     # Public interface
     # -------------------------------------------------------------------------
 
-    async def fetch_markets(self, max_markets: int = 30) -> list[PolymarketMarket]:
+    async def fetch_markets(self, max_markets: int = 30, min_volume_24h: float = 0.0) -> list[PolymarketMarket]:
         """
         Fetch live markets from Polymarket.
         Returns filtered, volume-sorted markets with real-time prices.
 
         Rate-limited to respect Polymarket's API constraints.
+
+        Args:
+            max_markets: Maximum number of markets to return
+            min_volume_24h: Drop markets below this 24h volume before parsing
+                            their tokens and prices. A filtered result is
+                            returned as-is and does not replace the cache.
         """
         raw_markets = await self._fetch_gamma_markets(limit=max_markets * 3)
 
         if not raw_markets:
             logger.warning("No markets returned from Gamma API, using cache")
+            if min_volume_24h > 0:
+                return [m for m in self._cache if m.volume_24h >= min_volume_24h]
             return self._cache
 
         markets: list[PolymarketMarket] = []
@@ -335,6 +415,9 @@ class PolymarketClient:
                 if volume_total < MIN_VOLUME_USD and volume_24h < MIN_VOLUME_USD:
                     skipped_low_volume += 1
                     continue
+                if volume_24h < min_volume_24h:
+                    skipped_low_volume += 1
+                    continue
 
                 # Extract token info from clobTokenIds (parse properly - can be JSON string)
                 clob_token_ids = _parse_clob_token_ids(m.get("clobTokenIds"))
@@ -421,10 +504,15 @@ class PolymarketClient:
         # Cap at max_markets
         markets = markets[:max_markets]
 
-        # Update cache
-        if markets:
+        # Update cache (only with the unfiltered market set)
+        if markets and min_volume_24h <= 0:
             self._cache = markets
             self._cache_time = time.monotonic()
+            # Reversed so the first market in cache order wins a shared key
+            self._by_id = {}
+            for market in reversed(markets):
+                self._by_id[market.condition_id] = market
+                self._by_id[market.id] = market
             logger.info(
                 "Polymarket data refreshed",
                 market_count=len(markets),
@@ -458,14 +546,21 @@ class PolymarketClient:
         if not token_ids:
             return {}
 
-        return await self._fetch_clob_prices_batch(token_ids)
+        if len(token_ids) <= CLOB_PRICES_BATCH:
+            return await self._fetch_clob_prices_batch(token_ids)
+
+        chunks = await asyncio.gather(*(
+            self._fetch_clob_prices_batch(token_ids[i:i + CLOB_PRICES_BATCH])
+            for i in range(0, len(token_ids), CLOB_PRICES_BATCH)
+        ))
+        prices: dict[str, float] = {}
+        for chunk in chunks:
+            prices.update(chunk)
+        return prices
 
     def get_market_by_id(self, market_id: str) -> PolymarketMarket | None:
-        """Get a specific market from cache by ID."""
-        for market in self._cache:
-            if market.id == market_id or market.condition_id == market_id:
-                return market
-        return None
+        """Get a specific market from cache by ID or condition ID."""
+        return self._by_id.get(market_id)
 
     def get_market_stats(self) -> dict:
         """Get statistics about cached markets."""
@@ -478,11 +573,22 @@ class PolymarketClient:
                 "cache_age_seconds": 0.0,
             }
 
+        # Totals only change when the cache is replaced, so sum once per refresh
+        source, totals = self._cache_totals
+        if source is not self._cache:
+            totals = (
+                sum(m.volume_24h for m in self._cache),
+                sum(m.liquidity for m in self._cache),
+                sum(m.spread for m in self._cache) / len(self._cache),
+            )
+            self._cache_totals = (self._cache, totals)
+        total_volume, total_liquidity, avg_spread = totals
+
         return {
             "total_markets": len(self._cache),
-            "total_volume_24h": sum(m.volume_24h for m in self._cache),
-            "total_liquidity": sum(m.liquidity for m in self._cache),
-            "avg_spread": sum(m.spread for m in self._cache) / len(self._cache) if self._cache else 0.0,
+            "total_volume_24h": total_volume,
+            "total_liquidity": total_liquidity,
+            "avg_spread": avg_spread,
             "cache_age_seconds": time.monotonic() - self._cache_time if self._cache_time else 0.0,
             "ws_subscriptions": len(self._subscribed_markets),
             "ws_connected": self._ws_connection is not None,
@@ -496,10 +602,29 @@ class PolymarketClient:
             token_id: Polymarket CLOB token ID
 
         Returns:
-            Dict with 'bids' and 'asks', each a list of [price, size] pairs,
-            or None on failure
+            Dict with 'bids' and 'asks', each a list of {price, size} levels,
+            plus 'total_bid_size' / 'total_ask_size' summed while parsing and
+            'best_bid' / 'best_ask' / 'spread', or None on failure. A book
+            fetched within ORDERBOOK_CACHE_TTL is returned as-is, and
+            concurrent callers for the same token share one CLOB request;
+            treat the dict as read-only.
         """
-        await self._rate_limit()
+        cached = self._book_cache.get(token_id)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        task = self._book_inflight.get(token_id)
+        if task is None:
+            task = asyncio.create_task(self._fetch_orderbook(token_id))
+            self._book_inflight[token_id] = task
+            task.add_done_callback(lambda _t, k=token_id: self._book_inflight.pop(k, None))
+        # shield: a cancelled caller must not cancel the fetch others await
+        return await asyncio.shield(task)
+
+    async def _fetch_orderbook(self, token_id: str) -> dict | None:
+        if not await self._clob_rate_limit():
+            logger.warning("CLOB orderbook fetch skipped, rate limit queue full", token_id=token_id)
+            return None
         client = await self._get_client()
 
         try:
@@ -508,19 +633,28 @@ class PolymarketClient:
                 params={"token_id": token_id},
             )
             resp.raise_for_status()
-            data = resp.json()
-
-            return {
-                "bids": [
-                    {"price": float(o.get("price", 0)), "size": float(o.get("size", 0))}
-                    for o in data.get("bids", [])
-                ],
-                "asks": [
-                    {"price": float(o.get("price", 0)), "size": float(o.get("size", 0))}
-                    for o in data.get("asks", [])
-                ],
+            data = orjson.loads(resp.content)
+
+            bids, total_bid_size = _parse_book_side(data.get("bids", []))
+            asks, total_ask_size = _parse_book_side(data.get("asks", []))
+            best_bid = bids[0]["price"] if bids else 0
+            best_ask = asks[0]["price"] if asks else 0
+            book = {
+                "bids": bids,
+                "asks": asks,
+                "total_bid_size": total_bid_size,
+                "total_ask_size": total_ask_size,
+                "best_bid": best_bid,
+                "best_ask": best_ask,
+                "spread": best_ask - best_bid if best_bid and best_ask else 0,
                 "token_id": token_id,
             }
+            now = time.monotonic()
+            # Drop expired books so arbitrary token ids cannot pile up
+            if len(self._book_cache) > 256:
+                self._book_cache = {k: v for k, v in self._book_cache.items() if v[0] > now}
+            self._book_cache[token_id] = (now + ORDERBOOK_CACHE_TTL, book)
+            return book
         except Exception as e:
             logger.warning("CLOB orderbook fetch failed", token_id=token_id, error=str(e))
             return None
@@ -700,6 +834,7 @@ class PolymarketClient:
 
                             # Recalculate spread
                             market.spread = abs(market.yes_price - (1.0 - market.no_price))
+                            self._cache_totals = (None, self._cache_totals[1])
 
                             logger.debug(
                                 "Price updated via WebSocket",
@@ -11,15 +11,18 @@ It combines:
 """
 
 import asyncio
+import os
 import time
 from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Optional, Any
+from typing import Optional
 
 from fastapi import FastAPI, WebSocket
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+import anyio
 import structlog
 import uvicorn
 
@@ -33,6 +36,8 @@ from services.email_service import EmailService
 logger = structlog.get_logger()
 settings = get_settings()
 
+THREADPOOL_SIZE = int(os.environ.get("THREADPOOL_SIZE", "64"))
+
 # Optional imports (require numpy/pandas/scipy)
 try:
     from engine.blockchain import BlockchainPipeline, OrderFilledEvent, PositionsConvertedEvent
@@ -48,6 +53,16 @@ except ImportError as e:
     arbitrage_router = None
     ADVANCED_FEATURES_AVAILABLE = False
 
+# Council WorldState building blocks (quant stack, requires numpy)
+try:
+    from quant.council.agents import (
+        WorldState, MarketMicrostructure, NarrativeState,
+        OnChainState, PortfolioState
+    )
+except ImportError:
+    WorldState = MarketMicrostructure = NarrativeState = None
+    OnChainState = PortfolioState = None
+
 
 # =============================================================================
 # Application State
@@ -64,6 +79,7 @@ class AppState:
         self.quant_engine: QuantEngine = QuantEngine()
         self.email_service: EmailService = EmailService()
         self.live_signals: list[QuantSignal] = []
+        self.live_signals_api: list[dict] = []  # /api/v2/signals projection of live_signals
         self._background_tasks: list[asyncio.Task] = []
 
         # V2 Quant modules (initialized in startup)
@@ -282,96 +298,6 @@ class AppState:
         except Exception as e:
             logger.error("Failed to initialize Polymarket WebSocket", error=str(e))
 
-    def build_world_state(self, market_id: str) -> Optional[Any]:
-        """
-        Build a complete WorldState for a market (Phase 5).
-
-        Aggregates data from FeatureEngineer, NarrativeVelocity, and other sources
-        into a single WorldState object for Council decision-making.
-
-        Args:
-            market_id: Market to build state for
-
-        Returns:
-            WorldState object or None if insufficient data
-        """
-        try:
-            if not self.feature_engineer or not self.narrative_velocity:
-                return None
-
-            # Get market data
-            market = self.polymarket_client.get_market_by_id(market_id)
-            if not market:
-                return None
-
-            # Compute features
-            features = self.feature_engineer.compute(market_id)
-            if not features or not features.is_valid:
-                return None
-
-            # Get narrative signal
-            narrative = self.narrative_velocity.compute_signal(market_id)
-
-            # Build WorldState components
-            from quant.council.agents import (
-                WorldState, MarketMicrostructure, NarrativeState,
-                OnChainState, PortfolioState
-            )
-            import time
-
-            micro = MarketMicrostructure(
-                order_book_imbalance=features.order_book_imbalance,
-                volume_z_score=features.volume_z_score,
-                momentum_1h=features.momentum_1h,
-                momentum_4h=0.0,  # Not computed yet
-                momentum_24h=0.0,  # Not computed yet
-                spread_bps=features.spread_bps,
-                liquidity_depth_usd=market.liquidity,
-                price_reversion_score=0.0,  # Not computed yet
-            )
-
-            narrative_state = NarrativeState(
-                sentiment_score=features.sentiment_score,
-                nvi_score=narrative.get("nvi_score", 0.0) if narrative else 0.0,
-                novelty_index=narrative.get("novelty", 0.0) if narrative else 0.0,
-                credibility_factor=narrative.get("credibility", 0.5) if narrative else 0.5,
-                sarcasm_probability=0.0,  # Not computed yet
-                tweet_volume_z=0.0,  # Not computed yet
-                narrative_coherence=narrative.get("coherence", 0.5) if narrative else 0.5,
-            )
-
-            on_chain = OnChainState(
-                smart_money_flow=0.0,  # Placeholder
-                whale_concentration=0.0,  # Placeholder
-                retail_flow=0.0,  # Placeholder
-                cross_platform_spread=0.0,  # Placeholder
-                gas_congestion_pct=0.0,  # Placeholder
-            )
-
-            portfolio = PortfolioState(
-                current_drawdown=0.0,  # Placeholder
-                correlated_exposure=0.0,  # Placeholder
-                leverage=0.0,  # Placeholder
-                sharpe_ratio=0.0,  # Placeholder
-                win_rate=0.5,  # Placeholder
-            )
-
-            world_state = WorldState(
-                market_id=market_id,
-                timestamp_ms=int(time.time() * 1000),
-                mid_price=features.mid_price,
-                micro=micro,
-                narrative=narrative_state,
-                on_chain=on_chain,
-                portfolio=portfolio,
-            )
-
-            return world_state
-
-        except Exception as e:
-            logger.error("Failed to build WorldState", market_id=market_id, error=str(e))
-            return None
-
     async def _on_price_update(self, token_id: str, price_data: dict) -> None:
         """
         WebSocket price update callback for real-time tick ingestion (Phase 5).
@@ -512,6 +438,14 @@ class AppState:
                 if markets:
                     signals = self.quant_engine.analyze(markets)
                     self.live_signals = signals
+                    self.live_signals_api = [
+                        {
+                            **s.to_api_dict(),
+                            # YES if positive edge, NO otherwise
+                            "prediction": "YES" if s.kelly_edge > 0 else "NO",
+                        }
+                        for s in signals
+                    ]
 
                     # Update active markets list for V2 pipeline
                     self.active_markets = [m.id for m in markets[:20]]
@@ -926,26 +860,22 @@ class AppState:
         Build a real WorldState for the Council from live data.
         This is THE BRIDGE between data collection and Council deliberation.
         """
-        from quant.council.agents import (
-            WorldState, MarketMicrostructure, NarrativeState,
-            OnChainState, PortfolioState
-        )
-
         # Get market data
         cached = self.polymarket_client.get_cached()
         market = next((m for m in cached if m.id == market_id), None)
         if not market:
             return None
 
-        # Get features if available
-        features = None
-        if self.feature_engineer:
-            features = self.feature_engineer.compute(market_id)
+        # Get features and narrative (if available) concurrently
+        async def _none():
+            return None
 
-        # Get narrative if available
-        narrative = None
-        if self.narrative_velocity:
-            narrative = self.narrative_velocity.compute(market_id)
+        features, narrative = await asyncio.gather(
+            run_in_threadpool(self.feature_engineer.compute, market_id)
+            if self.feature_engineer else _none(),
+            run_in_threadpool(self.narrative_velocity.compute, market_id)
+            if self.narrative_velocity else _none(),
+        )
 
         # Build microstructure
         micro = MarketMicrostructure(
@@ -1098,8 +1028,30 @@ state = AppState()
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
-    # Startup
+    # Quant endpoints offload CPU-bound compute via run_in_threadpool; widen
+    # AnyIO's default 40-thread limiter so bursts don't queue behind it.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+
+    # Startup — create DB tables once (request handlers assume they exist)
+    try:
+        from db.models import init_db
+        init_db()
+    except Exception as e:
+        logger.warning("⚠️ Database init failed", error=str(e))
+
     await state.startup()
+
+    # Cross-worker engine log fan-out (no-op without REDIS_URL)
+    from api.websocket_manager import engine_logs_manager
+    await engine_logs_manager.start_pubsub()
+
+    # Cross-worker v2 response cache invalidation (no-op without REDIS_URL)
+    try:
+        from api.routes import start_cache_invalidation
+        await start_cache_invalidation()
+    except Exception as e:
+        logger.warning("⚠️ V2 cache invalidation not started", error=str(e))
+
     # Start engine log broadcast loop (for dashboard WebSocket)
     _engine_log_task = asyncio.create_task(_engine_log_broadcast_loop())
 
@@ -1125,6 +1077,22 @@ async def lifespan(app: FastAPI):
         await _engine_log_task
     except asyncio.CancelledError:
         pass
+
+    try:
+        from api.engine_router import close_http_client
+        await close_http_client()
+    except Exception as e:
+        logger.warning("Engine router shutdown error", error=str(e))
+    await engine_logs_manager.stop_pubsub()
+
+    try:
+        from api.routes import stop_cache_invalidation, stop_headline_log, close_data_api_client
+        await stop_cache_invalidation()
+        await stop_headline_log()
+        await close_data_api_client()
+    except Exception as e:
+        logger.warning("V2 cache shutdown error", error=str(e))
+
     await state.shutdown()
 
 
@@ -1809,4 +1777,7 @@ if __name__ == "__main__":
         port=settings.api_port,
         reload=settings.debug,
         log_level="info",
+        loop="uvloop",
+        http="httptools",
+        ws="websockets",
     )
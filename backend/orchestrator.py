@@ -17,12 +17,15 @@ from typing import Any, Optional
 
 import httpx
 import structlog
+from sqlalchemy import update
 
 from ai.council import (
     AlphaCandidate,
     CouncilDecision,
     MarketSummary,
-    analyze_candidate,
+    analyze_first_valid,
+    cache_sweeper_loop,
+    close_clients,
     scan_for_alpha,
 )
 from api.websocket_manager import engine_logs_manager
@@ -33,6 +36,7 @@ from db.session import get_session
 logger = structlog.get_logger()
 
 _scanner_task: Optional[asyncio.Task] = None
+_sweeper_task: Optional[asyncio.Task] = None
 
 GAMMA_API_URL = "https://gamma-api.polymarket.com/markets"
 DRY_RUN = os.environ.get("POLYMARKET_DRY_RUN", "true").lower() == "true"
@@ -142,6 +146,7 @@ async def _execute_for_user(user_id: int, decision: CouncilDecision) -> None:
     Keys are decrypted in-memory, used once, discarded.
     Nothing sensitive is ever logged.
     """
+    trade_delta: Optional[dict] = None
     try:
         init_db()
         with get_session() as session:
@@ -211,6 +216,11 @@ async def _execute_for_user(user_id: int, decision: CouncilDecision) -> None:
                 pnl=0.0,
             )
             session.add(trade)
+            session.execute(
+                update(BotInstance)
+                .where(BotInstance.user_id == user_id)
+                .values(total_trades_count=BotInstance.total_trades_count + 1)
+            )
 
             # Update heartbeat
             bot = session.query(BotInstance).filter(BotInstance.user_id == user_id).first()
@@ -220,9 +230,21 @@ async def _execute_for_user(user_id: int, decision: CouncilDecision) -> None:
                     f"{'[SIM]' if DRY_RUN else '[LIVE]'} "
                     f"{decision.recommended_side} ${size:.2f} — {decision.question[:40]}..."
                 )
+                # Carry every changed field so push-only clients need no /status refetch
+                trade_delta = {
+                    "type": "status_delta",
+                    "last_log": bot.last_log,
+                    "total_trades_count": bot.total_trades_count,
+                    "current_pnl": bot.current_pnl,
+                    "new_trade": True,
+                }
 
             await _log(user_id, f"[OK] Trade logged. Cycle complete.")
 
+        # Sent after the session commits, so a client refetching on receipt sees the new row
+        if trade_delta:
+            await engine_logs_manager.send_event(user_id, trade_delta)
+
     except Exception as e:
         logger.error("Worker error", user_id=user_id, error=str(e))
         await _log(user_id, f"[ERROR] Worker cycle failed. Bot set to ERROR state.")
@@ -232,6 +254,10 @@ async def _execute_for_user(user_id: int, decision: CouncilDecision) -> None:
                 if bot:
                     bot.status = BotStatus.ERROR
                     bot.last_log = f"Error: {str(e)[:80]}"
+            # /status maps every non-RUNNING bot (ERROR included) to STOPPED; the error goes in last_log
+            await engine_logs_manager.send_event(
+                user_id, {"type": "status_delta", "status": "STOPPED", "last_log": f"Error: {str(e)[:80]}"}
+            )
         except Exception:
             pass
 
@@ -310,17 +336,15 @@ async def global_scanner_loop() -> None:
                 await asyncio.sleep(60)
                 continue
 
-            # Step 3: Analyst (GPT-4o) for each candidate → first valid decision wins
-            decision: Optional[CouncilDecision] = None
+            # Step 3: Analyst (GPT-4o) on candidates in parallel → highest-ranked valid
+            # decision wins; lower-ranked analyses are cancelled once it is known
             for candidate in candidates:
                 await _broadcast_log(
                     running_users,
                     f"[SCAN] Reviewing: {candidate.market.question[:60]}... "
                     f"(scanner confidence: {int(candidate.scanner_confidence*100)}%)",
                 )
-                decision = await analyze_candidate(candidate)
-                if decision:
-                    break
+            decision: Optional[CouncilDecision] = await analyze_first_valid(candidates)
 
             if not decision:
                 await _broadcast_log(running_users, "[SCAN] Candidates analyzed — no trade signal. Standing by.")
@@ -345,13 +369,21 @@ async def global_scanner_loop() -> None:
 
 
 def start_scanner() -> asyncio.Task:
-    global _scanner_task
+    global _scanner_task, _sweeper_task
     _scanner_task = asyncio.create_task(global_scanner_loop())
+    _sweeper_task = asyncio.create_task(cache_sweeper_loop())
     return _scanner_task
 
 
 async def stop_scanner() -> None:
-    global _scanner_task
+    global _scanner_task, _sweeper_task
+    if _sweeper_task:
+        _sweeper_task.cancel()
+        try:
+            await _sweeper_task
+        except asyncio.CancelledError:
+            pass
+        _sweeper_task = None
     if _scanner_task:
         _scanner_task.cancel()
         try:
@@ -360,3 +392,4 @@ async def stop_scanner() -> None:
             pass
         _scanner_task = None
         logger.info("[SCAN] Global scanner stopped")
+    await close_clients()
@@ -11,6 +11,7 @@ Plus: CorrelationTracker for real-time correlation monitoring.
 
 from __future__ import annotations
 
+import heapq
 import math
 from collections import defaultdict, deque
 from dataclasses import dataclass
@@ -232,29 +233,114 @@ class CorrelationTracker:
         corr = np.corrcoef(arr_a, arr_b)[0, 1]
         return corr if not np.isnan(corr) else 0.0
 
-    def get_correlated_pairs(self, threshold: float = 0.65) -> list[tuple[str, str, float]]:
+    def _correlation_matrix(self) -> tuple[list[str], np.ndarray]:
+        """
+        Pairwise correlations for every tracked market, in one vectorized pass.
+
+        Same rules as get_correlation(): each pair is aligned on its common
+        timestamps, and pairs with too few samples or no variance get 0.0.
+        Pairwise sums come from matmuls over a (timestamps x markets) price
+        matrix and its presence mask instead of re-aligning every pair.
+
+        Returns:
+            (market_ids, NxN correlation matrix in market_ids order)
+        """
+        market_ids = list(self._price_history.keys())
+        corr = np.zeros((len(market_ids), len(market_ids)))
+
+        eligible = [
+            i for i, market_id in enumerate(market_ids)
+            if len(self._price_history[market_id]) >= self._min_samples
+        ]
+        if len(eligible) < 2:
+            return market_ids, corr
+
+        # Last price per timestamp wins, as in get_correlation()
+        columns = [dict(self._price_history[market_ids[i]]) for i in eligible]
+        row_of = {ts: row for row, ts in enumerate(sorted(set().union(*columns)))}
+
+        prices = np.zeros((len(row_of), len(eligible)))
+        present = np.zeros_like(prices)
+        for col, history in enumerate(columns):
+            rows = np.fromiter((row_of[ts] for ts in history), dtype=np.intp, count=len(history))
+            prices[rows, col] = np.fromiter(history.values(), dtype=np.float64, count=len(history))
+            present[rows, col] = 1.0
+
+        # [a, b] entries are taken over the timestamps a and b share
+        n_common = present.T @ present
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean_a = (prices.T @ present) / n_common
+            var_a = np.maximum(((prices * prices).T @ present) / n_common - mean_a ** 2, 0.0)
+            cov = (prices.T @ prices) / n_common - mean_a * mean_a.T
+            std_a = np.sqrt(var_a)
+            pair_corr = cov / (std_a * std_a.T)
+
+        valid = (
+            (n_common >= self._min_samples)
+            & (std_a >= 1e-6)
+            & (std_a.T >= 1e-6)
+            & np.isfinite(pair_corr)
+        )
+        corr[np.ix_(eligible, eligible)] = np.where(valid, np.clip(pair_corr, -1.0, 1.0), 0.0)
+        return market_ids, corr
+
+    def _iter_correlated_pairs(self, threshold: float):
+        market_ids, corr = self._correlation_matrix()
+
+        # Upper triangle in row-major order: same pair order as a nested loop
+        rows, cols = np.triu_indices(len(market_ids), k=1)
+        values = corr[rows, cols]
+        for k in np.flatnonzero(np.abs(values) >= threshold):
+            yield (market_ids[rows[k]], market_ids[cols[k]], float(values[k]))
+
+    def get_correlated_pairs(
+        self, threshold: float = 0.65, top_k: Optional[int] = None
+    ) -> list[tuple[str, str, float]]:
         """
         Find all market pairs with correlation above threshold.
 
         Args:
             threshold: Minimum absolute correlation (default 0.65)
+            top_k: If set, return only the top_k strongest pairs
 
         Returns:
             List of (market_a, market_b, correlation) tuples
         """
-        pairs = []
-        market_ids = list(self._price_history.keys())
+        if top_k is not None:
+            return self.top_correlated_pairs(threshold, top_k)[0]
 
-        for i, market_a in enumerate(market_ids):
-            for market_b in market_ids[i + 1:]:
-                corr = self.get_correlation(market_a, market_b)
-                if abs(corr) >= threshold:
-                    pairs.append((market_a, market_b, corr))
+        pairs = list(self._iter_correlated_pairs(threshold))
 
         # Sort by absolute correlation (descending)
         pairs.sort(key=lambda x: abs(x[2]), reverse=True)
         return pairs
 
+    def top_correlated_pairs(
+        self, threshold: float, top_k: int
+    ) -> tuple[list[tuple[str, str, float]], int]:
+        """
+        Strongest top_k pairs above threshold, plus how many pairs qualified.
+
+        Keeps a bounded min-heap of size top_k while scanning, so selecting
+        the leaders costs O(P log k) instead of sorting all P qualifying pairs.
+
+        Returns:
+            (pairs sorted by |correlation| descending, total qualifying count)
+        """
+        heap: list[tuple[float, int, tuple[str, str, float]]] = []
+        count = 0
+        for pair in self._iter_correlated_pairs(threshold):
+            # Negated sequence keeps the earlier pair on ties, like a stable sort
+            entry = (abs(pair[2]), -count, pair)
+            count += 1
+            if len(heap) < top_k:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+
+        heap.sort(reverse=True)
+        return [pair for _, _, pair in heap], count
+
     def clear_history(self, market_id: Optional[str] = None):
         """Clear price history for a market (or all markets if None)."""
         if market_id is None:
@@ -528,9 +614,17 @@ class RiskManager:
         """Get correlation between two markets."""
         return self._correlation_tracker.get_correlation(market_a, market_b)
 
-    def get_correlated_pairs(self, threshold: float = 0.65) -> list[tuple[str, str, float]]:
-        """Get correlated market pairs."""
-        return self._correlation_tracker.get_correlated_pairs(threshold)
+    def get_correlated_pairs(
+        self, threshold: float = 0.65, top_k: Optional[int] = None
+    ) -> list[tuple[str, str, float]]:
+        """Get correlated market pairs (optionally only the top_k strongest)."""
+        return self._correlation_tracker.get_correlated_pairs(threshold, top_k)
+
+    def top_correlated_pairs(
+        self, threshold: float, top_k: int
+    ) -> tuple[list[tuple[str, str, float]], int]:
+        """Get the top_k correlated pairs and the total qualifying count."""
+        return self._correlation_tracker.top_correlated_pairs(threshold, top_k)
 
     def get_active_stops(self) -> dict[str, TrailingStop]:
         """Get all active trailing stops."""
@@ -25,6 +25,10 @@ class EmailService:
 
         # Load existing waitlist
         self.waitlist = self._load_waitlist()
+        # email → queue position, kept in step with waitlist["emails"]
+        self.waitlist_positions: dict[str, int] = {
+            e["email"]: e["position"] for e in self.waitlist["emails"]
+        }
 
     def _load_waitlist(self) -> dict:
         """Load waitlist from disk."""
@@ -54,11 +58,11 @@ class EmailService:
         email = email.lower().strip()
 
         # Check if already registered
-        existing = next((e for e in self.waitlist["emails"] if e["email"] == email), None)
-        if existing:
+        existing_position = self.waitlist_positions.get(email)
+        if existing_position is not None:
             return {
                 "status": "already_registered",
-                "queue_position": existing["position"],
+                "queue_position": existing_position,
                 "message": "You're already on the list!",
             }
 
@@ -73,6 +77,7 @@ class EmailService:
         }
 
         self.waitlist["emails"].append(entry)
+        self.waitlist_positions[email] = position
         self._save_waitlist()
 
         # Send welcome email
@@ -275,3 +280,7 @@ This is an automated message. Do not reply to this email.
     def get_waitlist_count(self) -> int:
         """Get total number of people on waitlist."""
         return self.waitlist["count"]
+
+    def get_waitlist_position(self, email: str) -> Optional[int]:
+        """Get the queue position for an email, or None if not on the waitlist."""
+        return self.waitlist_positions.get(email.lower().strip())
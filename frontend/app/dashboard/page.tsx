@@ -50,34 +50,40 @@ export default function DashboardPage() {
     if (autoScroll) scrollToBottom()
   }, [logs, autoScroll, scrollToBottom])
 
-  const fetchStatus = useCallback(async () => {
+  // Same fields as the socket's status / status_delta frames; returns whether the engine answered
+  const fetchStatus = useCallback(async (): Promise<boolean> => {
     try {
       const res = await fetch(`${API_BASE}/api/engine/status`)
       const data = await res.json()
-      setEngineOffline(false)
-      setIsBotActive(data.active ?? false)
-      setCurrentPnl(typeof data.pnl === "number" ? data.pnl : 0)
+      setIsBotActive(typeof data.status === "string" ? data.status === "RUNNING" : data.active ?? false)
+      const pnl = data.current_pnl ?? data.pnl
+      setCurrentPnl(typeof pnl === "number" ? pnl : 0)
+      return true
     } catch {
-      setEngineOffline(true)
       setIsBotActive(false)
       setCurrentPnl(0)
+      return false
     }
   }, [])
 
+  // One-shot cold start; afterwards the engine pushes status over the log socket
   useEffect(() => {
-    fetchStatus()
-    const id = setInterval(fetchStatus, 10000)
-    return () => clearInterval(id)
+    fetchStatus().then((ok) => setEngineOffline(!ok))
   }, [fetchStatus])
 
   useEffect(() => {
     if (engineOffline) {
       setLogs((prev) => (prev.includes(ENGINE_OFFLINE) ? prev : [...prev, ENGINE_OFFLINE]))
-      return
+      // Only while offline: probe until the engine answers, then the socket reconnects
+      const id = setInterval(() => {
+        fetchStatus().then((ok) => ok && setEngineOffline(false))
+      }, 10000)
+      return () => clearInterval(id)
     }
     const wsUrl = `${WS_BASE}/api/engine/logs/1`
     const ws = new WebSocket(wsUrl)
     wsRef.current = ws
+    let disposed = false
 
     ws.onopen = () => {
       setLogs((prev) => prev.filter((l) => l !== ENGINE_OFFLINE))
@@ -85,11 +91,22 @@ export default function DashboardPage() {
 
     ws.onmessage = (e) => {
       try {
-        const data = JSON.parse(e.data)
-        const msg = typeof data.message === "string" ? data.message : String(data.message ?? "")
-        if (msg) {
-          const ts = formatTimestamp()
-          setLogs((prev) => [...prev.slice(-99), `${ts} ${msg}`])
+        const parsed = JSON.parse(e.data)
+        // The engine batches bursts of frames into a JSON array
+        const frames = Array.isArray(parsed) ? parsed : [parsed]
+        for (const data of frames) {
+          if (data.type === "status" || data.type === "status_delta") {
+            if (typeof data.status === "string") setIsBotActive(data.status === "RUNNING")
+            if (typeof data.current_pnl === "number") setCurrentPnl(data.current_pnl)
+          }
+        }
+        const ts = formatTimestamp()
+        const lines = frames
+          .map((data) => (typeof data.message === "string" ? data.message : String(data.message ?? "")))
+          .filter(Boolean)
+          .map((msg) => `${ts} ${msg}`)
+        if (lines.length) {
+          setLogs((prev) => [...prev, ...lines].slice(-100))
         }
       } catch {
         setLogs((prev) => [...prev.slice(-99), `${formatTimestamp()} ${e.data}`])
@@ -99,17 +116,24 @@ export default function DashboardPage() {
     ws.onerror = () => {
       setEngineOffline(true)
       setLogs((prev) => (prev.includes(ENGINE_OFFLINE) ? prev : [...prev, ENGINE_OFFLINE]))
+      // Pushes stopped; resync once over HTTP
+      fetchStatus()
     }
 
     ws.onclose = () => {
       wsRef.current = null
+      if (disposed) return
+      // Server-side close (restart, 1013 at capacity): resync, then reconnect via the offline probe
+      fetchStatus()
+      setEngineOffline(true)
     }
 
     return () => {
+      disposed = true
       ws.close()
       wsRef.current = null
     }
-  }, [engineOffline])
+  }, [engineOffline, fetchStatus])
 
   const handleSaveCredentials = async () => {
     setSaving(true)
@@ -3,4 +3,4 @@
 
 cd backend
 pip install -r requirements.txt
-uvicorn main:app --host 0.0.0.0 --port ${PORT:-8000}
+uvicorn main:app --host 0.0.0.0 --port ${PORT:-8000} --loop uvloop --http httptools --ws websockets